@@ -2,22 +2,35 @@
 Admin configuration for availability app.
 """
 
+from datetime import date, timedelta
+
 from django.contrib import admin
 from unfold.admin import ModelAdmin
+from unfold.contrib.filters.admin import RangeDateFilter
 
 from .models import Availability
 
 
 @admin.register(Availability)
 class AvailabilityAdmin(ModelAdmin):
-    """Admin interface for Availability model."""
+    """
+    Admin interface for Availability model.
+
+    The changelist defaults to the last `recent_days` days; use the date range
+    filter to list older slots.
+    """
 
     list_display = ["teacher", "date", "start_time", "end_time", "meeting_type", "created_at"]
-    list_filter = ["meeting_type", "date", "teacher"]
+    list_select_related = ["teacher"]
+    # A from/to range on date instead of date_hierarchy, whose drill-down links
+    # run DISTINCT date-truncation queries over the whole table
+    list_filter = ["meeting_type", ("date", RangeDateFilter), "teacher"]
+    list_filter_submit = True
     search_fields = ["teacher__email", "teacher__first_name", "teacher__last_name"]
-    date_hierarchy = "date"
     ordering = ["-date", "start_time"]
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["end_time", "created_at", "updated_at"]
+    # Changelist shows this many days back unless a date filter is applied
+    recent_days = 90
 
     fieldsets = (
         (
@@ -34,3 +47,17 @@ class AvailabilityAdmin(ModelAdmin):
             },
         ),
     )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+
+        # Only bound the changelist; change/delete views must still reach older rows
+        match = request.resolver_match
+        changelist_url = f"{self.opts.app_label}_{self.opts.model_name}_changelist"
+        if match is None or match.url_name != changelist_url:
+            return queryset
+
+        if any(param.startswith("date") for param in request.GET):
+            return queryset
+
+        return queryset.filter(date__gte=date.today() - timedelta(days=self.recent_days))
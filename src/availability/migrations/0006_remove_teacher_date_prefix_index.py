@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("availability", "0005_expand_availability_message"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="availability",
+            name="availabilit_teacher_baa40e_idx",
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("availability", "0006_remove_teacher_date_prefix_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="availability",
+            name="date",
+            field=models.DateField(),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:59
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("availability", "0007_remove_availability_date_index"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="availability",
+            name="end_time",
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("availability", "0008_remove_availability_end_time"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="availability",
+            index=models.Index(fields=["date", "start_time"], name="avail_date_time_idx"),
+        ),
+    ]
@@ -2,19 +2,32 @@
 Models for the availability app.
 """
 
+from datetime import date, datetime, timedelta
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils.functional import cached_property
 
 User = get_user_model()
 
+# Meetings are always MEETING_DURATION long; resolved once at import
+_MEETING_MINUTES = settings.AVAILABILITY_SETTINGS.get("MEETING_DURATION", 30)
+_MEETING_DURATION = timedelta(minutes=_MEETING_MINUTES)
+
+
+def meeting_end_time(start_time):
+    """End time of a meeting starting at start_time (start_time + MEETING_DURATION)."""
+    return (datetime.combine(date.min, start_time) + _MEETING_DURATION).time()
+
 
 class Availability(models.Model):
     """
     Represents a teacher's availability for a specific time slot on a specific date.
 
-    Each availability slot is 30 minutes long (two consecutive 15-minute slots).
+    Each availability slot is 30 minutes long (two consecutive 15-minute slots),
+    so only the start time is stored and end_time is derived from it.
     """
 
     class MeetingType(models.TextChoices):
@@ -28,9 +41,8 @@ class Availability(models.Model):
         related_name="availabilities",
         limit_choices_to={"role": "teacher"},
     )
-    date = models.DateField(db_index=True)
+    date = models.DateField()
     start_time = models.TimeField()
-    end_time = models.TimeField()
     meeting_type = models.CharField(
         max_length=20,
         choices=MeetingType.choices,
@@ -47,11 +59,15 @@ class Availability(models.Model):
 
     class Meta:
         verbose_name_plural = "Availabilities"
+        # The unique index on (teacher, date, start_time) also serves the
+        # per-teacher day/month lookups and their start_time ordering.
         unique_together = [["teacher", "date", "start_time"]]
-        ordering = ["date", "start_time"]
         indexes = [
-            models.Index(fields=["teacher", "date"]),
+            # Cross-teacher range scans (booking page, upcoming lists) filter on
+            # date__gte and sort by date, start_time
+            models.Index(fields=["date", "start_time"], name="avail_date_time_idx"),
         ]
+        ordering = ["date", "start_time"]
 
     def __str__(self):
         return (
@@ -60,20 +76,31 @@ class Availability(models.Model):
             f"({self.get_meeting_type_display()})"
         )
 
+    @property
+    def end_time(self):
+        if self.start_time is None:
+            return None
+        return meeting_end_time(self.start_time)
+
+    @cached_property
+    def display_date(self):
+        """Date as shown in booking messages, e.g. "March 05, 2025"."""
+        return self.date.strftime("%B %d, %Y")
+
+    @cached_property
+    def display_time(self):
+        """Start time as shown in booking messages, e.g. "9:30 AM"."""
+        return self.start_time.strftime("%-I:%M %p")
+
     def clean(self):
-        """Validate that the time slot is exactly 30 minutes."""
-        if self.start_time and self.end_time:
-            # Calculate duration
-            from datetime import datetime
-
-            start_dt = datetime.combine(self.date, self.start_time)
-            end_dt = datetime.combine(self.date, self.end_time)
-            duration = (end_dt - start_dt).total_seconds() / 60
-
-            meeting_duration = settings.AVAILABILITY_SETTINGS.get("MEETING_DURATION", 30)
-            if duration != meeting_duration:
-                raise ValidationError(f"Time slot must be exactly {meeting_duration} minutes long.")
-
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
+        """Validate that the meeting ends on the same day it starts."""
+        if self.start_time:
+            start_dt = datetime.combine(date.min, self.start_time)
+            if (start_dt + _MEETING_DURATION).date() != start_dt.date():
+                raise ValidationError(
+                    f"Time slot must be {_MEETING_MINUTES} minutes long and end by midnight."
+                )
+
+
+# Display labels keyed by stored value, for code paths that read .values() rows
+MEETING_TYPE_DISPLAY = dict(Availability.MeetingType.choices)
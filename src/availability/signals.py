@@ -0,0 +1,16 @@
+"""
+Signals for the availability app.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Availability
+from .utils import invalidate_calendar_cache
+
+
+@receiver(post_save, sender=Availability, dispatch_uid="availability.availability_changed")
+@receiver(post_delete, sender=Availability, dispatch_uid="availability.availability_changed")
+def availability_changed(sender, instance: Availability, **kwargs):
+    """Drop the cached calendar months for the slot's teacher."""
+    invalidate_calendar_cache(instance.teacher_id)
@@ -0,0 +1,22 @@
+import datetime
+
+from django.core.exceptions import ValidationError
+import pytest
+
+from availability.models import Availability
+
+
+def _slot(hour, minute):
+    return Availability(date=datetime.date.today(), start_time=datetime.time(hour, minute))
+
+
+def test_end_time_is_derived_from_start_time():
+    assert _slot(9, 45).end_time == datetime.time(10, 15)
+    assert Availability().end_time is None
+
+
+def test_clean_rejects_slot_past_midnight():
+    _slot(23, 15).clean()
+
+    with pytest.raises(ValidationError):
+        _slot(23, 45).clean()
@@ -0,0 +1,159 @@
+import datetime
+
+import pytest
+
+from availability.models import Availability
+from availability.utils import (
+    generate_time_slots,
+    generate_upcoming_time_slots,
+    get_calendar_data,
+)
+from booking.models import Booking
+from users.models import User
+
+
+@pytest.fixture
+def teacher_user():
+    return User.objects.create_user(
+        email="slots-teacher@example.com",
+        password="pass",
+        role=User.Roles.TEACHER,
+    )
+
+
+@pytest.fixture
+def student_user():
+    return User.objects.create_user(
+        email="slots-student@example.com",
+        password="pass",
+        first_name="Sam",
+        last_name="Student",
+        role=User.Roles.STUDENT,
+    )
+
+
+@pytest.fixture
+def slot_date():
+    return datetime.date.today() + datetime.timedelta(days=3)
+
+
+def _slot_at(slots, hour, minute):
+    return next(slot for slot in slots if slot["start_time"] == datetime.time(hour, minute))
+
+
+@pytest.mark.django_db
+def test_generate_time_slots_marks_available_blocked_and_booked(
+    teacher_user, student_user, slot_date
+):
+    booked = Availability.objects.create(
+        teacher=teacher_user,
+        date=slot_date,
+        start_time=datetime.time(9, 0),
+        meeting_type=Availability.MeetingType.ONLINE,
+        message="Bring notebook",
+    )
+    Availability.objects.create(
+        teacher=teacher_user,
+        date=slot_date,
+        start_time=datetime.time(11, 0),
+        meeting_type=Availability.MeetingType.IN_PERSON,
+    )
+    Booking.objects.create(availability=booked, student=student_user, message="See you")
+
+    slots = generate_time_slots(slot_date, teacher=teacher_user)
+
+    nine = _slot_at(slots, 9, 0)
+    assert nine["is_available"] is True
+    assert nine["availability_id"] == booked.id
+    assert nine["message"] == "Bring notebook"
+    assert nine["is_booked"] is True
+    assert nine["booking_student_name"] == "Sam Student"
+    assert nine["booking_student_email"] == student_user.email
+    assert nine["booking_message"] == "See you"
+    assert nine["display_time"] == "09:00 AM - 09:30 AM"
+
+    quarter_past = _slot_at(slots, 9, 15)
+    assert quarter_past["is_available"] is False
+    assert quarter_past["is_blocked"] is True
+    assert quarter_past["blocking_meeting_type"] == Availability.MeetingType.ONLINE
+
+    eleven = _slot_at(slots, 11, 0)
+    assert eleven["is_available"] is True
+    assert eleven["is_booked"] is False
+    assert eleven["booking_student_name"] == ""
+
+    assert _slot_at(slots, 9, 30)["is_blocked"] is False
+
+
+@pytest.mark.django_db
+def test_generate_time_slots_without_teacher_returns_empty_grid(slot_date):
+    slots = generate_time_slots(slot_date)
+
+    assert slots
+    assert not any(slot["is_available"] or slot["is_blocked"] for slot in slots)
+    assert slots[0]["start_time"] == datetime.time(6, 0)
+    assert slots[-1]["end_time"] == datetime.time(23, 0)
+
+
+@pytest.mark.django_db
+def test_generate_upcoming_time_slots_matches_per_date_generation(teacher_user, slot_date):
+    next_day = slot_date + datetime.timedelta(days=2)
+    for day, hour in ((next_day, 10), (slot_date, 9), (slot_date, 14)):
+        Availability.objects.create(teacher=teacher_user, date=day, start_time=datetime.time(hour))
+    Availability.objects.create(
+        teacher=teacher_user,
+        date=slot_date - datetime.timedelta(days=1),
+        start_time=datetime.time(9),
+    )
+
+    by_date = generate_upcoming_time_slots(teacher_user, slot_date)
+
+    assert list(by_date) == [slot_date, next_day]
+    for day, slots in by_date.items():
+        assert slots == generate_time_slots(day, teacher=teacher_user)
+
+
+@pytest.mark.django_db
+def test_get_calendar_data_counts_slots_per_day(teacher_user, slot_date):
+    for hour, meeting_type in (
+        (9, Availability.MeetingType.ONLINE),
+        (10, Availability.MeetingType.ONLINE),
+        (11, Availability.MeetingType.BOTH),
+    ):
+        Availability.objects.create(
+            teacher=teacher_user,
+            date=slot_date,
+            start_time=datetime.time(hour, 0),
+            meeting_type=meeting_type,
+        )
+
+    data = get_calendar_data(slot_date.year, slot_date.month, teacher=teacher_user)
+
+    days = {day["day"]: day for week in data["weeks"] for day in week if day["day"]}
+    info = days[slot_date.day]["availability"]
+    assert (info["total"], info["online"], info["in_person"], info["both"]) == (3, 2, 0, 1)
+    assert [slot["start_time"] for slot in info["slots"]] == ["09:00 AM", "10:00 AM", "11:00 AM"]
+    assert info["slots"][2]["meeting_type_display"] == "Both (Online + In-person)"
+    assert all(
+        day["availability"] is None for number, day in days.items() if number != slot_date.day
+    )
+
+
+@pytest.mark.django_db
+def test_get_calendar_data_cache_is_invalidated_on_availability_writes(teacher_user, slot_date):
+    def day_info():
+        data = get_calendar_data(slot_date.year, slot_date.month, teacher=teacher_user)
+        days = {day["day"]: day for week in data["weeks"] for day in week if day["day"]}
+        return days[slot_date.day]["availability"]
+
+    assert day_info() is None
+
+    slot = Availability.objects.create(
+        teacher=teacher_user,
+        date=slot_date,
+        start_time=datetime.time(9, 0),
+    )
+    assert day_info()["total"] == 1
+
+    slot.delete()
+    assert day_info() is None
@@ -0,0 +1,136 @@
+import datetime
+
+from django.urls import reverse
+import pytest
+
+from availability.models import Availability
+from booking.models import Booking
+from users.models import User
+
+
+@pytest.fixture
+def teacher_user():
+    return User.objects.create_user(
+        email="views-teacher@example.com",
+        password="pass",
+        role=User.Roles.TEACHER,
+    )
+
+
+@pytest.mark.django_db
+def test_availability_list_fetches_all_dates_in_one_query(
+    client, teacher_user, django_assert_num_queries
+):
+    today = datetime.date.today()
+    for offset in (-1, 0, 2, 5):
+        Availability.objects.create(
+            teacher=teacher_user,
+            date=today + datetime.timedelta(days=offset),
+            start_time=datetime.time(9, 0),
+        )
+    client.force_login(teacher_user)
+
+    # Session, user, and the availability rows for every upcoming date
+    with django_assert_num_queries(3):
+        response = client.get(reverse("availability:availability_list"))
+
+    assert response.status_code == 200
+    dates = [entry["date"] for entry in response.context["availability_by_date"]]
+    assert dates == [today + datetime.timedelta(days=offset) for offset in (0, 2, 5)]
+    assert all(entry["slot_count"] == 1 for entry in response.context["availability_by_date"])
+
+
+@pytest.mark.django_db
+def test_upcoming_availability_list_joins_bookings_and_students(
+    client, teacher_user, django_assert_num_queries
+):
+    admin_user = User.objects.create_user(
+        email="views-admin@example.com",
+        password="pass",
+        role=User.Roles.ADMIN,
+    )
+    today = datetime.date.today()
+    for index, hour in enumerate((9, 10, 11)):
+        availability = Availability.objects.create(
+            teacher=teacher_user,
+            date=today + datetime.timedelta(days=index),
+            start_time=datetime.time(hour, 0),
+        )
+        student = User.objects.create_user(
+            email=f"views-student{index}@example.com",
+            password="pass",
+            role=User.Roles.STUDENT,
+        )
+        Booking.objects.create(availability=availability, student=student)
+    client.force_login(admin_user)
+
+    # Session, user, and one joined query however many slots are booked
+    with django_assert_num_queries(3):
+        response = client.get(reverse("availability:upcoming_availability"))
+
+    assert response.status_code == 200
+    assert b"views-student2@example.com" in response.content
+
+
+@pytest.mark.django_db
+def test_save_availability_parses_iso_date_and_time(client, teacher_user):
+    client.force_login(teacher_user)
+    url = reverse("availability:save_availability")
+    slot_date = datetime.date.today() + datetime.timedelta(days=1)
+
+    response = client.post(
+        url,
+        {"date": slot_date.isoformat(), "start_time": "09:30:00", "meeting_type": "online"},
+    )
+
+    assert response.status_code == 200
+    slot = Availability.objects.get(teacher=teacher_user)
+    assert (slot.date, slot.start_time) == (slot_date, datetime.time(9, 30))
+    assert response.json()["action"] == "created"
+    assert response.json()["availability_id"] == slot.id
+
+    response = client.post(
+        url,
+        {"date": slot_date.isoformat(), "start_time": "09:30:00", "meeting_type": "in_person"},
+    )
+
+    assert response.json()["action"] == "updated"
+    assert response.json()["availability_id"] == slot.id
+
+    for date_str, time_str in (
+        ("not-a-date", "09:30:00"),
+        (slot_date.isoformat(), "09:30"),
+        (slot_date.isoformat(), "09:30:00+01:00"),
+    ):
+        response = client.post(
+            url, {"date": date_str, "start_time": time_str, "meeting_type": "online"}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "Invalid date or time"
+
+
+@pytest.mark.django_db
+def test_save_availability_rejects_bad_requests_with_400(client, teacher_user):
+    client.force_login(teacher_user)
+    url = reverse("availability:save_availability")
+    slot_date = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+
+    for data, error in (
+        ({"date": slot_date, "start_time": "09:00", "action": "move"}, "Invalid action"),
+        ({"date": slot_date, "meeting_type": "online"}, "Missing required fields"),
+        (
+            {"date": slot_date, "start_time": "09:00", "meeting_type": "phone"},
+            "Invalid meeting type",
+        ),
+        (
+            {"date": slot_date, "start_time": "23:45:00", "meeting_type": "online"},
+            "end by midnight",
+        ),
+    ):
+        response = client.post(url, data)
+
+        assert response.status_code == 400
+        assert error in response.json()["error"]
+
+    assert not Availability.objects.exists()
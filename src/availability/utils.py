@@ -3,9 +3,88 @@ Calendar generation utilities for the availability app.
 """
 
 import calendar
+from collections import defaultdict
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from core.cache import bump_cache_version, cache_version
+
+from .models import Availability, meeting_end_time, MEETING_TYPE_DISPLAY
+
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_NAMES = tuple(calendar.month_name)
+
+
+def _calendar_version_key(teacher_id) -> str:
+    return f"availability:calendar-version:{teacher_id}"
+
+
+def _calendar_version(teacher_id) -> int:
+    """Current cache version for a teacher's calendar months."""
+    return cache_version(_calendar_version_key(teacher_id))
+
+
+def invalidate_calendar_cache(teacher_id) -> None:
+    """Invalidate every cached calendar month of a teacher (called on availability writes)."""
+    bump_cache_version(_calendar_version_key(teacher_id))
+
+
+def _month_availability(year: int, month: int, teacher) -> dict:
+    """Per-day availability counts and tooltip slots for a teacher's month, keyed by day."""
+    # Get all availabilities for this teacher in this month
+    first_day = date(year, month, 1)
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+
+    month_availabilities = Availability.objects.filter(
+        teacher=teacher, date__range=(first_day, last_day)
+    )
+
+    availability_by_date = {}
+
+    # Per-day counts are aggregated by the database
+    day_counts = (
+        month_availabilities.order_by("date")
+        .values("date")
+        .annotate(
+            total=Count("id"),
+            online=Count("id", filter=Q(meeting_type=Availability.MeetingType.ONLINE)),
+            in_person=Count("id", filter=Q(meeting_type=Availability.MeetingType.IN_PERSON)),
+            both=Count("id", filter=Q(meeting_type=Availability.MeetingType.BOTH)),
+        )
+    )
+    for row in day_counts:
+        availability_by_date[row["date"].day] = {
+            "total": row["total"],
+            "online": row["online"],
+            "in_person": row["in_person"],
+            "both": row["both"],
+            "slots": [],
+        }
+
+    # Add slot details for tooltip
+    slot_rows = month_availabilities.order_by("date", "start_time").values_list(
+        "date", "start_time", "meeting_type", "message"
+    )
+    for slot_date, start_time, meeting_type, message in slot_rows:
+        day_info = availability_by_date.get(slot_date.day)
+        if day_info is None:
+            # Row written between the two queries; it shows up on the next render
+            continue
+        day_info["slots"].append(
+            {
+                "start_time": start_time.strftime("%I:%M %p"),
+                "end_time": meeting_end_time(start_time).strftime("%I:%M %p"),
+                "meeting_type": meeting_type,
+                "meeting_type_display": MEETING_TYPE_DISPLAY.get(meeting_type, meeting_type),
+                "message": message,
+            }
+        )
+
+    return availability_by_date
 
 
 def get_calendar_data(year: int, month: int, teacher=None) -> dict:
@@ -28,7 +107,6 @@ def get_calendar_data(year: int, month: int, teacher=None) -> dict:
     """
     # Get the calendar for the month
     cal = calendar.monthcalendar(year, month)
-    month_name = calendar.month_name[month]
 
     # Get current date for highlighting
     today = date.today()
@@ -36,71 +114,37 @@ def get_calendar_data(year: int, month: int, teacher=None) -> dict:
     # Get availability data for this teacher and month
     availability_by_date = {}
     if teacher:
-        from .models import Availability
-
-        # Get all availabilities for this teacher in this month
-        first_day = date(year, month, 1)
-        # Get last day of month
-        if month == 12:
-            last_day = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            last_day = date(year, month + 1, 1) - timedelta(days=1)
-
-        availabilities = Availability.objects.filter(
-            teacher=teacher, date__gte=first_day, date__lte=last_day
-        ).order_by("date", "start_time")
-
-        # Group by date with counts and slot details
-        for avail in availabilities:
-            day_num = avail.date.day
-            if day_num not in availability_by_date:
-                availability_by_date[day_num] = {
-                    "total": 0,
-                    "online": 0,
-                    "in_person": 0,
-                    "both": 0,
-                    "slots": [],
-                }
-            availability_by_date[day_num]["total"] += 1
-            availability_by_date[day_num][avail.meeting_type] += 1
-            # Add slot details for tooltip
-            availability_by_date[day_num]["slots"].append(
-                {
-                    "start_time": avail.start_time.strftime("%I:%M %p"),
-                    "end_time": avail.end_time.strftime("%I:%M %p"),
-                    "meeting_type": avail.meeting_type,
-                    "meeting_type_display": avail.get_meeting_type_display(),
-                    "message": avail.message,
-                }
-            )
-
-    # Build weeks with day information
-    weeks = []
-    for week in cal:
-        week_data = []
-        for day in week:
-            if day == 0:
-                # Empty day (from previous/next month)
-                week_data.append(
-                    {
-                        "day": None,
-                        "is_today": False,
-                        "is_current_month": False,
-                        "availability": None,
-                    }
-                )
-            else:
-                is_today = day == today.day and month == today.month and year == today.year
-                availability_info = availability_by_date.get(day)
-                week_data.append(
-                    {
-                        "day": day,
-                        "is_today": is_today,
-                        "is_current_month": True,
-                        "availability": availability_info,
-                    }
-                )
-        weeks.append(week_data)
+        cache_key = (
+            f"availability:calendar:{teacher.pk}:{year}:{month}:{_calendar_version(teacher.pk)}"
+        )
+        availability_by_date = cache.get_or_set(
+            cache_key,
+            lambda: _month_availability(year, month, teacher),
+            settings.AVAILABILITY_SETTINGS.get("CALENDAR_CACHE_TIMEOUT", 300),
+        )
+
+    # Build weeks with day information (0 marks a day from the previous/next month)
+    today_key = (today.year, today.month, today.day)
+    days = [
+        (
+            {
+                "day": day,
+                "is_today": (year, month, day) == today_key,
+                "is_current_month": True,
+                "availability": availability_by_date.get(day),
+            }
+            if day
+            else {
+                "day": None,
+                "is_today": False,
+                "is_current_month": False,
+                "availability": None,
+            }
+        )
+        for week in cal
+        for day in week
+    ]
+    weeks = [days[i : i + 7] for i in range(0, len(days), 7)]
 
     # Calculate previous and next month
     prev_month = get_prev_month(year, month)
@@ -109,45 +153,78 @@ def get_calendar_data(year: int, month: int, teacher=None) -> dict:
     return {
         "year": year,
         "month": month,
-        "month_name": month_name,
+        "month_name": MONTH_NAMES[month],
         "weeks": weeks,
         "prev_month": prev_month,
         "next_month": next_month,
-        "weekday_names": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        "weekday_names": WEEKDAY_NAMES,
     }
 
 
 def get_prev_month(year: int, month: int) -> tuple[int, int]:
     """Get the previous month (year, month)."""
-    if month == 1:
-        return (year - 1, 12)
-    return (year, month - 1)
+    index = year * 12 + (month - 1) - 1
+    return (index // 12, index % 12 + 1)
 
 
 def get_next_month(year: int, month: int) -> tuple[int, int]:
     """Get the next month (year, month)."""
-    if month == 12:
-        return (year + 1, 1)
-    return (year, month + 1)
-
+    index = year * 12 + (month - 1) + 1
+    return (index // 12, index % 12 + 1)
+
+
+@lru_cache(maxsize=8)
+def _slot_skeleton(
+    start_hour: int,
+    start_minute: int,
+    end_hour: int,
+    end_minute: int,
+    slot_duration: int,
+    meeting_duration: int,
+) -> tuple[tuple[time, time, str], ...]:
+    """
+    Build the fixed (start_time, end_time, display_time) grid for the configured day.
 
-def validate_date(year: int, month: int, day: int) -> bool:
+    The grid only depends on AVAILABILITY_SETTINGS, so it is computed once per
+    configuration and shared by every generate_time_slots() call.
     """
-    Validate if a date is valid.
+    skeleton = []
+    current_time = datetime.combine(date.min, time(start_hour, start_minute))
+    end_time_dt = datetime.combine(date.min, time(end_hour, end_minute))
 
-    Args:
-        year: Year (e.g., 2025)
-        month: Month (1-12)
-        day: Day (1-31)
+    while current_time < end_time_dt:
+        slot_end_dt = current_time + timedelta(minutes=meeting_duration)
+
+        # Skip this slot if the meeting would extend past the end time
+        if slot_end_dt > end_time_dt:
+            break
+
+        skeleton.append(
+            (
+                current_time.time(),
+                slot_end_dt.time(),
+                f"{current_time.strftime('%I:%M %p')} - {slot_end_dt.strftime('%I:%M %p')}",
+            )
+        )
+
+        # Move to next 15-minute slot
+        current_time += timedelta(minutes=slot_duration)
+
+    return tuple(skeleton)
 
-    Returns:
-        True if valid, False otherwise
-    """
-    try:
-        date(year, month, day)
-        return True
-    except ValueError:
-        return False
+
+# Columns read for each existing slot when overlaying a teacher's day on the grid
+_SLOT_ROW_FIELDS = (
+    "id",
+    "start_time",
+    "meeting_type",
+    "message",
+    "booking__id",
+    "booking__message",
+    "booking__student__first_name",
+    "booking__student__last_name",
+    "booking__student__email",
+)
 
 
 def generate_time_slots(selected_date: date, teacher=None) -> list[dict]:
@@ -171,96 +248,103 @@ def generate_time_slots(selected_date: date, teacher=None) -> list[dict]:
         - availability_id: int or None (database ID if exists)
         - message: str (optional message for the time slot)
     """
+    # Fetch this teacher's slots for the date once; the same rows feed both the
+    # start-time lookup and the blocked-slot scan.
+    rows = []
+    if teacher:
+        rows = list(
+            Availability.objects.filter(teacher=teacher, date=selected_date).values_list(
+                *_SLOT_ROW_FIELDS, named=True
+            )
+        )
+
+    return _build_time_slots(rows)
+
+
+def generate_upcoming_time_slots(teacher, start_date: date) -> dict[date, list[dict]]:
+    """
+    Generate time slots for every date from start_date on where the teacher has availability.
+
+    The dates are discovered from the same query that fetches the slots, so the
+    whole lookup is a single query.
+
+    Returns:
+        Dictionary mapping each date with availability, in chronological order,
+        to the list of slot dictionaries that generate_time_slots() returns for it.
+    """
+    rows_by_date = _slot_rows_by_date(
+        Availability.objects.filter(teacher=teacher, date__gte=start_date).order_by("date")
+    )
+
+    return {slot_date: _build_time_slots(rows) for slot_date, rows in rows_by_date.items()}
+
+
+def _slot_rows_by_date(queryset) -> defaultdict:
+    """Fetch _SLOT_ROW_FIELDS (plus the date) for queryset and group the rows by date."""
+    rows_by_date = defaultdict(list)
+    for row in queryset.values_list("date", *_SLOT_ROW_FIELDS, named=True):
+        rows_by_date[row.date].append(row)
+    return rows_by_date
+
+
+def _build_time_slots(rows) -> list[dict]:
+    """Overlay one day's availability rows (see _SLOT_ROW_FIELDS) on the slot grid."""
     config = settings.AVAILABILITY_SETTINGS
     start_hour, start_minute = map(int, config["START_TIME"].split(":"))
     end_hour, end_minute = map(int, config["END_TIME"].split(":"))
     slot_duration = config["SLOT_DURATION"]
     meeting_duration = config["MEETING_DURATION"]
 
-    # Get existing availabilities for this teacher and date
-    existing_availabilities = {}
-    if teacher:
-        from .models import Availability
-
-        availabilities = Availability.objects.filter(
-            teacher=teacher, date=selected_date
-        ).select_related("booking__student")
-        for avail in availabilities:
-            # Key by start_time
-            booking = getattr(avail, "booking", None)
-            booking_student = getattr(booking, "student", None)
-            booked_student_name = ""
-            booked_student_email = ""
-            if booking_student:
-                booked_student_name = booking_student.get_full_name() or booking_student.email
-                booked_student_email = booking_student.email
-
-            existing_availabilities[avail.start_time] = {
-                "meeting_type": avail.meeting_type,
-                "availability_id": avail.id,
-                "message": avail.message,
-                "is_booked": booking is not None,
-                "booking_student_name": booked_student_name,
-                "booking_student_email": booked_student_email,
-                "booking_message": booking.message if booking else "",
-            }
-
-    slots = []
-    current_time = datetime.combine(selected_date, time(start_hour, start_minute))
-    end_time_dt = datetime.combine(selected_date, time(end_hour, end_minute))
-
-    # Get all availabilities for checking blocked slots
-    all_availabilities = []
-    if teacher:
-        from .models import Availability
-
-        all_availabilities = list(Availability.objects.filter(teacher=teacher, date=selected_date))
+    # Key by start_time
+    existing_availabilities = {row.start_time: row for row in rows}
 
-    while current_time < end_time_dt:
-        slot_start = current_time.time()
-        slot_end_dt = current_time + timedelta(minutes=meeting_duration)
-        slot_end = slot_end_dt.time()
-
-        # Skip this slot if the meeting would extend past the end time
-        if slot_end_dt > end_time_dt:
-            break
+    # Map every grid slot that falls inside an existing meeting (after its start)
+    # to that meeting's type, so blocked checks are a single dict lookup.
+    blocked_map: dict[time, str] = {}
+    for row in rows:
+        row_start = datetime.combine(date.min, row.start_time)
+        for offset in range(slot_duration, meeting_duration, slot_duration):
+            blocked_map[(row_start + timedelta(minutes=offset)).time()] = row.meeting_type
 
+    slots = []
+    for slot_start, slot_end, display_time in _slot_skeleton(
+        start_hour, start_minute, end_hour, end_minute, slot_duration, meeting_duration
+    ):
         # Check if this slot has availability (i.e., this is the start of a meeting)
         avail_data = existing_availabilities.get(slot_start)
 
         # Check if this slot is blocked by an existing meeting
         # A slot is blocked if it falls within an existing 30-minute meeting
-        is_blocked = False
-        blocking_meeting_type = None
-        for availability in all_availabilities:
-            # Check if current slot start time falls within this availability's meeting time
-            if availability.start_time < slot_start < availability.end_time:
-                is_blocked = True
-                blocking_meeting_type = availability.meeting_type
-                break
-
-        slot_info = {
-            "start_time": slot_start,
-            "end_time": slot_end,
-            "display_time": (
-                f"{current_time.strftime('%I:%M %p')} - "
-                f"{(current_time + timedelta(minutes=meeting_duration)).strftime('%I:%M %p')}"
-            ),
-            "is_available": avail_data is not None,
-            "meeting_type": avail_data["meeting_type"] if avail_data else None,
-            "availability_id": avail_data["availability_id"] if avail_data else None,
-            "message": avail_data["message"] if avail_data else "",
-            "is_blocked": is_blocked,
-            "blocking_meeting_type": blocking_meeting_type,
-            "is_booked": bool(avail_data and avail_data.get("is_booked")),
-            "booking_student_name": (avail_data or {}).get("booking_student_name", ""),
-            "booking_student_email": (avail_data or {}).get("booking_student_email", ""),
-            "booking_message": (avail_data or {}).get("booking_message", ""),
-        }
-
-        slots.append(slot_info)
-
-        # Move to next 15-minute slot
-        current_time += timedelta(minutes=slot_duration)
+        blocking_meeting_type = blocked_map.get(slot_start)
+        is_blocked = blocking_meeting_type is not None
+
+        is_booked = bool(avail_data and avail_data.booking__id is not None)
+        booked_student_name = ""
+        booked_student_email = ""
+        if is_booked and avail_data.booking__student__email:
+            full_name = (
+                f"{avail_data.booking__student__first_name} "
+                f"{avail_data.booking__student__last_name}"
+            ).strip()
+            booked_student_name = full_name or avail_data.booking__student__email
+            booked_student_email = avail_data.booking__student__email
+
+        slots.append(
+            {
+                "start_time": slot_start,
+                "end_time": slot_end,
+                "display_time": display_time,
+                "is_available": avail_data is not None,
+                "meeting_type": avail_data.meeting_type if avail_data else None,
+                "availability_id": avail_data.id if avail_data else None,
+                "message": avail_data.message if avail_data else "",
+                "is_blocked": is_blocked,
+                "blocking_meeting_type": blocking_meeting_type,
+                "is_booked": is_booked,
+                "booking_student_name": booked_student_name,
+                "booking_student_email": booked_student_email,
+                "booking_message": avail_data.booking__message if is_booked else "",
+            }
+        )
 
     return slots
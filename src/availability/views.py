@@ -2,19 +2,45 @@
 Views for the availability app.
 """
 
-from collections import OrderedDict
-from datetime import date, datetime, timedelta
+from datetime import date, time, timedelta
+from itertools import groupby
+from operator import attrgetter
 
-from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.http import Http404, JsonResponse
-from django.shortcuts import redirect, render
+from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_http_methods
 
 from booking.models import Booking
 from users.decorators import role_required
 
 from .models import Availability
-from .utils import generate_time_slots, get_calendar_data, validate_date
+from .utils import (
+    generate_time_slots,
+    generate_upcoming_time_slots,
+    get_calendar_data,
+)
+
+User = get_user_model()
+
+_VALID_MEETING_TYPES = frozenset(Availability.MeetingType.values)
+
+
+def _resolve_viewing_teacher(request):
+    """
+    Return the teacher named by the teacher_id GET/POST param, or None if absent.
+
+    Only the user columns the availability pages read are fetched.
+    """
+    teacher_id = request.GET.get("teacher_id") or request.POST.get("teacher_id")
+    if not teacher_id:
+        return None
+    return get_object_or_404(
+        User.objects.only("id", "role", "first_name", "last_name", "email"),
+        id=teacher_id,
+        role="teacher",
+    )
 
 
 @role_required(["teacher", "admin"])
@@ -25,8 +51,6 @@ def calendar_view(request, year=None, month=None):
     If year/month are not provided, defaults to current month.
     For admins, can view a specific teacher's calendar via teacher_id param.
     """
-    from django.shortcuts import get_object_or_404
-
     today = date.today()
 
     # Default to current year/month if not provided
@@ -50,16 +74,9 @@ def calendar_view(request, year=None, month=None):
 
     if request.user.role == "admin":
         # Admin viewing a teacher's calendar
-        teacher_id = request.GET.get("teacher_id")
-        if teacher_id:
-            from django.contrib.auth import get_user_model
-
-            User = get_user_model()
-            viewing_teacher = get_object_or_404(User, id=teacher_id, role="teacher")
-            is_admin_view = True
-            teacher = viewing_teacher
-        else:
-            teacher = None
+        viewing_teacher = _resolve_viewing_teacher(request)
+        is_admin_view = viewing_teacher is not None
+        teacher = viewing_teacher
     else:
         # Teacher viewing their own calendar
         viewing_teacher = request.user
@@ -85,19 +102,15 @@ def date_detail_view(request, year, month, day):
     Shows the selected date information.
     For admins, they can view/edit availability for a teacher specified by teacher_id param.
     """
-    from django.shortcuts import get_object_or_404
-
     # Validate the date
     try:
         year = int(year)
         month = int(month)
         day = int(day)
 
-        if not validate_date(year, month, day):
-            raise Http404("Invalid date")
-
+        # date() performs the calendar check itself (month range, leap years)
         selected_date = date(year, month, day)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         raise Http404("Invalid date")
 
     # Determine which teacher's calendar to show
@@ -106,13 +119,8 @@ def date_detail_view(request, year, month, day):
 
     if request.user.role == "admin":
         # Admin viewing a teacher's calendar
-        teacher_id = request.GET.get("teacher_id")
-        if teacher_id:
-            from django.contrib.auth import get_user_model
-
-            User = get_user_model()
-            viewing_teacher = get_object_or_404(User, id=teacher_id, role="teacher")
-            is_admin_view = True
+        viewing_teacher = _resolve_viewing_teacher(request)
+        is_admin_view = viewing_teacher is not None
         time_slots = (
             generate_time_slots(selected_date, teacher=viewing_teacher) if viewing_teacher else []
         )
@@ -122,11 +130,9 @@ def date_detail_view(request, year, month, day):
         time_slots = generate_time_slots(selected_date, teacher=request.user)
 
     # Calculate previous and next dates for navigation
-    from datetime import date as date_class
-
     prev_date = selected_date - timedelta(days=1)
     next_date = selected_date + timedelta(days=1)
-    today = date_class.today()
+    today = date.today()
     show_prev = prev_date >= today  # Only show previous button if not going to past
 
     context = {
@@ -159,29 +165,17 @@ def availability_list(request):
     Only shows the actual slots that are set (not all possible time slots).
     Allows inline editing of slots.
     """
-    from collections import OrderedDict
-
     # Show only upcoming dates (today and future)
     today = date.today()
-    availabilities = Availability.objects.filter(teacher=request.user, date__gte=today).order_by(
-        "date", "start_time"
-    )
 
-    # Group by date
-    dates_with_slots = OrderedDict()
-    for avail in availabilities:
-        if avail.date not in dates_with_slots:
-            dates_with_slots[avail.date] = []
-        dates_with_slots[avail.date].append(avail)
+    # Generate all time slots (for blocking info) for every upcoming date in one query
+    time_slots_by_date = generate_upcoming_time_slots(request.user, today)
 
     # For each date, only include the slots that are actually set
     availability_by_date = []
-    for date_obj, slots in dates_with_slots.items():
-        # Generate all time slots to get blocking info
-        all_time_slots = generate_time_slots(date_obj, teacher=request.user)
-
+    for date_obj, time_slots in time_slots_by_date.items():
         # Filter to only show slots that are set (is_available = True)
-        set_slots = [slot for slot in all_time_slots if slot["is_available"]]
+        set_slots = [slot for slot in time_slots if slot["is_available"]]
 
         availability_by_date.append(
             {
@@ -193,7 +187,7 @@ def availability_list(request):
 
     context = {
         "availability_by_date": availability_by_date,
-        "has_slots": len(availability_by_date) > 0,
+        "has_slots": bool(availability_by_date),
     }
 
     return render(request, "availability/availability_list.html", context)
@@ -207,40 +201,32 @@ def upcoming_availability_list(request):
     Admin-only view that shows all availability slots from today onwards,
     with options to filter by meeting type and group by teacher or date.
     """
-    from collections import OrderedDict
-
     # Show only upcoming dates (today and future)
     today = date.today()
     tomorrow = today + timedelta(days=1)
-    availabilities = (
+    availabilities = list(
         Availability.objects.filter(date__gte=today)
         .select_related("teacher", "booking__student")
         .order_by("date", "start_time", "teacher__last_name", "teacher__first_name")
     )
 
-    # Prepare data for both grouping options
-    # Group by teacher
-    by_teacher = OrderedDict()
+    # Prepare data for both grouping options in a single pass.
+    # Rows are ordered by date, so a teacher's slots are not contiguous.
+    by_teacher = {}
+    by_date = {}
     for avail in availabilities:
-        teacher_key = avail.teacher.id
-        if teacher_key not in by_teacher:
-            by_teacher[teacher_key] = {
+        if avail.teacher_id not in by_teacher:
+            by_teacher[avail.teacher_id] = {
                 "teacher": avail.teacher,
                 "slots": [],
             }
-        by_teacher[teacher_key]["slots"].append(avail)
-
-    # Group by date
-    by_date = OrderedDict()
-    for avail in availabilities:
-        if avail.date not in by_date:
-            by_date[avail.date] = []
-        by_date[avail.date].append(avail)
+        by_teacher[avail.teacher_id]["slots"].append(avail)
+        by_date.setdefault(avail.date, []).append(avail)
 
     context = {
         "availabilities_by_teacher": list(by_teacher.values()),
         "availabilities_by_date": by_date,
-        "has_slots": len(availabilities) > 0,
+        "has_slots": bool(by_date),
         "today": today,
         "tomorrow": tomorrow,
     }
@@ -277,16 +263,15 @@ def all_bookings_view(request):
 
     bookings = list(bookings_qs)
 
-    bookings_by_date = OrderedDict()
+    # Rows are ordered by date, so each date's bookings are contiguous
+    bookings_by_date = {
+        booking_date: list(group)
+        for booking_date, group in groupby(bookings, key=attrgetter("availability.date"))
+    }
     bookings_by_teacher = []
     teacher_map = {}
 
     for booking in bookings:
-        booking_date = booking.availability.date
-        if booking_date not in bookings_by_date:
-            bookings_by_date[booking_date] = []
-        bookings_by_date[booking_date].append(booking)
-
         teacher = booking.availability.teacher
         if teacher.id not in teacher_map:
             entry = {"teacher": teacher, "bookings": []}
@@ -324,82 +309,90 @@ def save_availability(request):
 
     Expects POST data:
     - date: YYYY-MM-DD
-    - start_time: HH:MM
+    - start_time: HH:MM:SS
     - meeting_type: online|in_person|both
     - message: (optional) short message or note for the time slot
     - action: set|delete
     - teacher_id: (optional, for admin editing on behalf of teacher)
     """
-    from django.shortcuts import get_object_or_404
-
-    try:
-        # Parse request data
-        date_str = request.POST.get("date")
-        start_time_str = request.POST.get("start_time")
-        meeting_type = request.POST.get("meeting_type")
-        message = request.POST.get("message", "")
-        action = request.POST.get("action", "set")
-        teacher_id = request.POST.get("teacher_id")
-
-        if not all([date_str, start_time_str]):
-            return JsonResponse({"success": False, "error": "Missing required fields"}, status=400)
-
-        # Determine which teacher's availability to modify
-        if request.user.role == "admin" and teacher_id:
-            # Admin editing on behalf of a teacher
-            from django.contrib.auth import get_user_model
-
-            User = get_user_model()
-            teacher = get_object_or_404(User, id=teacher_id, role="teacher")
-        else:
-            # Teacher editing their own availability
-            teacher = request.user
-
-        # Parse date and time
-        selected_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        start_time = datetime.strptime(start_time_str, "%H:%M:%S").time()
-
-        # Calculate end time (30 minutes later)
-        meeting_duration = settings.AVAILABILITY_SETTINGS.get("MEETING_DURATION", 30)
-        start_dt = datetime.combine(selected_date, start_time)
-        end_time = (start_dt + timedelta(minutes=meeting_duration)).time()
-
-        if action == "delete":
-            # Delete existing availability
-            Availability.objects.filter(
-                teacher=teacher, date=selected_date, start_time=start_time
-            ).delete()
-
-            return JsonResponse({"success": True, "action": "deleted"})
-
-        elif action == "set":
-            # Validate meeting type
-            if meeting_type not in ["online", "in_person", "both"]:
-                return JsonResponse({"success": False, "error": "Invalid meeting type"}, status=400)
-
-            # Create or update availability
-            availability, created = Availability.objects.update_or_create(
-                teacher=teacher,
-                date=selected_date,
-                start_time=start_time,
-                defaults={
-                    "end_time": end_time,
-                    "meeting_type": meeting_type,
-                    "message": message,
-                },
-            )
-
+    # Parse request data
+    date_str = request.POST.get("date")
+    start_time_str = request.POST.get("start_time")
+    meeting_type = request.POST.get("meeting_type")
+    message = request.POST.get("message", "")
+    action = request.POST.get("action", "set")
+
+    # Cheap checks first, so malformed requests are rejected before any parsing or lookups
+    if action not in ("set", "delete"):
+        return JsonResponse({"success": False, "error": "Invalid action"}, status=400)
+
+    if not all([date_str, start_time_str]):
+        return JsonResponse({"success": False, "error": "Missing required fields"}, status=400)
+
+    if action == "set":
+        # Validate meeting type
+        if meeting_type not in _VALID_MEETING_TYPES:
+            return JsonResponse({"success": False, "error": "Invalid meeting type"}, status=400)
+
+        # Model.save() no longer runs full_clean(), so check the message length here
+        max_message_length = Availability._meta.get_field("message").max_length
+        if len(message) > max_message_length:
             return JsonResponse(
                 {
-                    "success": True,
-                    "action": "created" if created else "updated",
-                    "availability_id": availability.id,
-                    "meeting_type": availability.meeting_type,
-                }
+                    "success": False,
+                    "error": f"Message must be at most {max_message_length} characters.",
+                },
+                status=400,
             )
 
-        else:
-            return JsonResponse({"success": False, "error": "Invalid action"}, status=400)
+    # Parse date and time
+    try:
+        selected_date = date.fromisoformat(date_str)
+        start_time = time.fromisoformat(start_time_str)
+        # Only naive HH:MM:SS, the format the calendar templates send; an aware
+        # time cannot be stored in the TimeField
+        if start_time.tzinfo is not None or start_time.isoformat() != start_time_str:
+            raise ValueError(start_time_str)
+    except ValueError:
+        return JsonResponse({"success": False, "error": "Invalid date or time"}, status=400)
+
+    # Admins may edit on behalf of a teacher; teachers edit their own availability
+    teacher = None
+    if request.user.role == "admin":
+        teacher = _resolve_viewing_teacher(request)
+    if teacher is None:
+        teacher = request.user
+
+    if action == "delete":
+        # Delete existing availability
+        Availability.objects.filter(
+            teacher=teacher, date=selected_date, start_time=start_time
+        ).delete()
+
+        return JsonResponse({"success": True, "action": "deleted"})
+
+    # Model.save() no longer runs full_clean(), so check the slot ends by midnight here
+    try:
+        Availability(start_time=start_time).clean()
+    except ValidationError as e:
+        return JsonResponse({"success": False, "error": " ".join(e.messages)}, status=400)
+
+    # Create or update availability
+    availability, created = Availability.objects.update_or_create(
+        teacher=teacher,
+        date=selected_date,
+        start_time=start_time,
+        defaults={
+            "meeting_type": meeting_type,
+            "message": message,
+        },
+    )
 
-    except Exception as e:
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    return JsonResponse(
+        {
+            "success": True,
+            "action": "created" if created else "updated",
+            "availability_id": availability.id,
+            "meeting_type": availability.meeting_type,
+        }
+    )
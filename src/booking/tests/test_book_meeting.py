@@ -0,0 +1,174 @@
+import datetime
+
+from django.urls import reverse
+import pytest
+
+from availability.models import Availability
+from booking.models import Booking
+from questionnaire.models import Questionnaire
+from users.models import User
+
+
+@pytest.fixture
+def teacher_user():
+    return User.objects.create_user(
+        email="book-teacher@example.com",
+        password="pass",
+        role=User.Roles.TEACHER,
+    )
+
+
+@pytest.fixture
+def student_user():
+    student = User.objects.create_user(
+        email="book-student@example.com",
+        password="pass",
+        role=User.Roles.STUDENT,
+    )
+    Questionnaire.objects.create(
+        student_profile=student.student_profile,
+        faculty_department="Languages",
+        mother_tongue="English",
+        university_status="Undergraduate",
+        language_mandatory_name="French",
+        language_mandatory_proficiency="B1",
+        language_mandatory_goals=["speaking"],
+        aspects_to_improve="Listening",
+        activities_you_can_manage="Reading",
+        hours_per_week="2",
+        completed=True,
+    )
+    return student
+
+
+@pytest.mark.django_db
+def test_book_meeting_hides_slots_booked_by_other_students(client, teacher_user, student_user):
+    other_student = User.objects.create_user(
+        email="book-other@example.com",
+        password="pass",
+        role=User.Roles.STUDENT,
+    )
+    slot_date = datetime.date.today() + datetime.timedelta(days=1)
+    mine, theirs, free = (
+        Availability.objects.create(
+            teacher=teacher_user, date=slot_date, start_time=datetime.time(hour, 0)
+        )
+        for hour in (9, 10, 11)
+    )
+    Booking.objects.create(availability=mine, student=student_user, message="Mine")
+    Booking.objects.create(availability=theirs, student=other_student)
+    client.force_login(student_user)
+
+    response = client.get(reverse("booking:book_meeting"))
+
+    assert response.status_code == 200
+    slots = response.context["availabilities_by_date"][slot_date]
+    assert [(slot.id, slot.is_my_booking) for slot in slots] == [(mine.id, True), (free.id, False)]
+    assert slots[0].booking.message == "Mine"
+    assert response.context["booked_dates"] == [slot_date.isoformat()]
+
+
+@pytest.mark.django_db
+def test_book_meeting_rejects_slot_already_booked(client, teacher_user, student_user):
+    other_student = User.objects.create_user(
+        email="book-other@example.com",
+        password="pass",
+        role=User.Roles.STUDENT,
+    )
+    slot = Availability.objects.create(
+        teacher=teacher_user,
+        date=datetime.date.today() + datetime.timedelta(days=1),
+        start_time=datetime.time(9, 0),
+    )
+    Booking.objects.create(availability=slot, student=other_student)
+    client.force_login(student_user)
+
+    response = client.post(reverse("booking:book_meeting"), {"availability_id": slot.id})
+
+    assert response.status_code == 400
+    assert response.json()["error"] == "This slot has already been booked."
+    assert not Booking.objects.filter(student=student_user).exists()
+
+
+@pytest.mark.django_db
+def test_book_meeting_books_free_slot(client, teacher_user, student_user):
+    slot = Availability.objects.create(
+        teacher=teacher_user,
+        date=datetime.date.today() + datetime.timedelta(days=1),
+        start_time=datetime.time(9, 0),
+    )
+    client.force_login(student_user)
+
+    response = client.post(
+        reverse("booking:book_meeting"), {"availability_id": slot.id, "message": "Hi"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert Booking.objects.get(student=student_user).availability == slot
+
+
+@pytest.mark.django_db
+def test_book_meeting_allows_one_booking_per_day(client, teacher_user, student_user):
+    slot_date = datetime.date.today() + datetime.timedelta(days=1)
+    booked, second = (
+        Availability.objects.create(
+            teacher=teacher_user, date=slot_date, start_time=datetime.time(hour, 0)
+        )
+        for hour in (9, 10)
+    )
+    Booking.objects.create(availability=booked, student=student_user)
+    client.force_login(student_user)
+
+    response = client.post(reverse("booking:book_meeting"), {"availability_id": second.id})
+
+    assert response.status_code == 400
+    assert "one slot per day" in response.json()["error"]
+    assert not hasattr(second, "booking")
+
+
+@pytest.mark.django_db
+def test_book_meeting_unknown_slot_returns_404(client, student_user):
+    client.force_login(student_user)
+
+    response = client.post(reverse("booking:book_meeting"), {"availability_id": 999999})
+
+    assert response.status_code == 404
+
+
+class FailingEmailBackend:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def send_messages(self, messages):
+        raise OSError("SMTP unavailable")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_book_and_cancel_succeed_when_notification_email_fails(
+    client, settings, caplog, teacher_user, student_user
+):
+    settings.EMAIL_BACKEND = "booking.tests.test_book_meeting.FailingEmailBackend"
+    settings.NOTIFICATIONS_SEND_ASYNC = False
+    slot = Availability.objects.create(
+        teacher=teacher_user,
+        date=datetime.date.today() + datetime.timedelta(days=1),
+        start_time=datetime.time(9, 0),
+    )
+    client.force_login(student_user)
+
+    response = client.post(reverse("booking:book_meeting"), {"availability_id": slot.id})
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    booking_id = response.json()["booking_id"]
+    assert Booking.objects.filter(id=booking_id).exists()
+
+    response = client.post(
+        reverse("booking:cancel_booking", args=[booking_id]), {"message": "Can't make it"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert not Booking.objects.filter(id=booking_id).exists()
+    assert "Sending notification" in caplog.text
@@ -0,0 +1,77 @@
+import datetime
+
+from django.urls import reverse
+import pytest
+
+from availability.models import Availability
+from booking.models import Booking
+from notifications.ics import build_booking_ics
+from users.models import User
+
+
+@pytest.fixture
+def booking():
+    teacher = User.objects.create_user(
+        email="ics-teacher@example.com",
+        password="pass",
+        role=User.Roles.TEACHER,
+    )
+    student = User.objects.create_user(
+        email="ics-student@example.com",
+        password="pass",
+        role=User.Roles.STUDENT,
+    )
+    availability = Availability.objects.create(
+        teacher=teacher,
+        date=datetime.date.today() + datetime.timedelta(days=1),
+        start_time=datetime.time(9, 0),
+    )
+    return Booking.objects.create(availability=availability, student=student)
+
+
+@pytest.mark.django_db
+def test_booking_ics_is_served_to_participants_and_admins(client, booking):
+    admin_user = User.objects.create_user(
+        email="ics-admin@example.com",
+        password="pass",
+        role=User.Roles.ADMIN,
+    )
+    url = reverse("booking:booking_ics", args=[booking.id])
+
+    for user in (booking.student, booking.availability.teacher, admin_user):
+        client.force_login(user)
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/calendar"
+        assert b"UID:booking-%d@advising" % booking.id in response.content
+
+
+@pytest.mark.django_db
+def test_booking_ics_hides_other_users_bookings(client, booking):
+    outsider = User.objects.create_user(
+        email="ics-outsider@example.com",
+        password="pass",
+        role=User.Roles.STUDENT,
+    )
+    client.force_login(outsider)
+
+    response = client.get(reverse("booking:booking_ics", args=[booking.id]))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_booking_ics_uses_crlf_and_escapes_text(booking):
+    booking.message = "Line one\nuse Zoom, room 3; bring notes"
+
+    ics = build_booking_ics(booking=booking)
+
+    lines = ics.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert "\n" not in "".join(lines)
+    assert (
+        "DESCRIPTION:Student: ics-student@example.com\\nAdvisor: ics-teacher@example.com"
+        "\\nStudent note: Line one\\nuse Zoom\\, room 3\\; bring notes"
+    ) in lines
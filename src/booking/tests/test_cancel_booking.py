@@ -36,7 +36,6 @@ def availability(teacher_user):
         teacher=teacher_user,
         date=datetime.date.today() + datetime.timedelta(days=2),
         start_time=datetime.time(10, 0),
-        end_time=datetime.time(10, 30),
         meeting_type=Availability.MeetingType.ONLINE,
     )
 
@@ -58,12 +57,16 @@ def test_cancel_booking_requires_message(client, booking, student_user):
 
 
 @pytest.mark.django_db
-def test_cancel_booking_with_message_succeeds(client, booking, student_user, mailoutbox):
+def test_cancel_booking_with_message_succeeds(
+    client, booking, student_user, mailoutbox, settings, django_capture_on_commit_callbacks
+):
+    settings.NOTIFICATIONS_SEND_ASYNC = False
     client.force_login(student_user)
     mailoutbox.clear()
     url = reverse("booking:cancel_booking", args=[booking.id])
     reason = "Can't make it"
-    response = client.post(url, data={"message": reason})
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url, data={"message": reason})
     assert response.status_code == 200
     data = response.json()
     assert data["success"] is True
@@ -2,13 +2,13 @@
 Views for the booking app.
 """
 
-from collections import OrderedDict
 from datetime import date, timedelta
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.db import transaction
-from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.db.models import Exists, OuterRef, Prefetch, Q
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
 
 from availability.models import Availability
@@ -42,6 +42,46 @@ def book_meeting(request):
 
         if availability_id:
             try:
+                # Cheap unlocked checks first, so attempts that will be turned away
+                # (slot taken, or a booking that day already) never open a
+                # transaction or queue on the row lock
+                slot = (
+                    Availability.objects.filter(id=availability_id)
+                    .annotate(
+                        # Whether the student already has a booking on this slot's date
+                        booked_on_date=Exists(
+                            Booking.objects.filter(
+                                student=request.user, availability__date=OuterRef("date")
+                            )
+                        )
+                    )
+                    .values_list("booking__id", "booked_on_date")
+                    .first()
+                )
+                if slot is None:
+                    return JsonResponse(
+                        {"success": False, "error": "Availability slot not found."}, status=404
+                    )
+                existing_booking_id, booked_on_date = slot
+
+                if existing_booking_id is not None:
+                    return JsonResponse(
+                        {"success": False, "error": "This slot has already been booked."},
+                        status=400,
+                    )
+
+                if booked_on_date:
+                    return JsonResponse(
+                        {
+                            "success": False,
+                            "error": (
+                                "You already have a booking on this date. "
+                                "You can only book one slot per day."
+                            ),
+                        },
+                        status=400,
+                    )
+
                 with transaction.atomic():
                     # Lock the availability row to prevent race conditions
                     availability = (
@@ -50,30 +90,13 @@ def book_meeting(request):
                         .get(id=availability_id)
                     )
 
-                    # Check if already booked
+                    # Re-check under the lock: the slot may have been booked since
                     if hasattr(availability, "booking"):
                         return JsonResponse(
                             {"success": False, "error": "This slot has already been booked."},
                             status=400,
                         )
 
-                    # Check if student already has a booking on this date
-                    existing_booking_on_date = Booking.objects.filter(
-                        student=request.user, availability__date=availability.date
-                    ).exists()
-
-                    if existing_booking_on_date:
-                        return JsonResponse(
-                            {
-                                "success": False,
-                                "error": (
-                                    "You already have a booking on this date. "
-                                    "You can only book one slot per day."
-                                ),
-                            },
-                            status=400,
-                        )
-
                     # Create the booking
                     booking = Booking.objects.create(
                         availability=availability, student=request.user, message=message
@@ -83,8 +106,8 @@ def book_meeting(request):
                         "Booking confirmed! Your "
                         f"{availability.get_meeting_type_display()} appointment with "
                         f"{availability.teacher.get_full_name() or availability.teacher.email} "
-                        f"on {availability.date.strftime('%B %d, %Y')} "
-                        f"at {availability.start_time.strftime('%-I:%M %p')} "
+                        f"on {availability.display_date} "
+                        f"at {availability.display_time} "
                         "has been scheduled."
                     )
 
@@ -109,72 +132,63 @@ def book_meeting(request):
     today = date.today()
     tomorrow = today + timedelta(days=1)
 
-    # Fetch all upcoming availability slots (both booked and unbooked)
+    # Fetch upcoming slots that are unbooked OR booked by the current student;
+    # slots booked by others are filtered out by the database
     availabilities = (
         Availability.objects.filter(date__gte=today)
+        .filter(Q(booking__isnull=True) | Q(booking__student=request.user))
         .select_related("teacher")
-        .prefetch_related("booking")
+        .prefetch_related(
+            Prefetch(
+                "booking",
+                queryset=Booking.objects.only("id", "availability", "message"),
+                to_attr="prefetched_booking",
+            )
+        )
+        # Only the columns the page renders
+        .only(
+            "id",
+            "date",
+            "start_time",
+            "meeting_type",
+            "message",
+            "teacher__id",
+            "teacher__first_name",
+            "teacher__last_name",
+            "teacher__email",
+        )
         .order_by("date", "start_time", "teacher__last_name", "teacher__first_name")
     )
 
-    # Get student's own bookings
-    student_booking_ids = set(
-        Booking.objects.filter(student=request.user, availability__date__gte=today).values_list(
-            "availability_id", flat=True
-        )
-    )
+    # Group by teacher and by date in a single pass. Every booked slot left is
+    # the student's own, so their upcoming bookings need no separate query.
+    by_teacher = {}
+    by_date = {}
+    booked_dates = []
+    for avail in availabilities:
+        # prefetched_booking is the slot's booking or None, so no DoesNotExist probe
+        booking = avail.prefetched_booking
 
-    # Create a mapping of availability_id to booking for student's bookings
-    student_bookings_dict = {
-        booking.availability_id: booking
-        for booking in Booking.objects.filter(
-            student=request.user, availability__date__gte=today
-        ).select_related("availability")
-    }
+        # Add flag to indicate if this is the student's booking
+        avail.is_my_booking = booking is not None
+        if avail.is_my_booking:
+            # Attach booking object for the template
+            avail.booking = booking
+            if avail.date not in booked_dates:
+                booked_dates.append(avail.date)
 
-    # Filter slots: show unbooked OR booked by current student (hide booked by others)
-    filtered_availabilities = []
-    for avail in availabilities:
-        is_booked_by_others = hasattr(avail, "booking") and avail.booking.student != request.user
-        if not is_booked_by_others:
-            # Add flag to indicate if this is the student's booking
-            avail.is_my_booking = avail.id in student_booking_ids
-            # Attach booking object if it's the student's booking
-            if avail.is_my_booking:
-                avail.booking = student_bookings_dict.get(avail.id)
-            filtered_availabilities.append(avail)
-
-    # Group by teacher
-    by_teacher = OrderedDict()
-    for avail in filtered_availabilities:
-        teacher_key = avail.teacher.id
-        if teacher_key not in by_teacher:
-            by_teacher[teacher_key] = {
-                "teacher": avail.teacher,
-                "slots": [],
-            }
-        by_teacher[teacher_key]["slots"].append(avail)
-
-    # Group by date
-    by_date = OrderedDict()
-    for avail in filtered_availabilities:
-        if avail.date not in by_date:
-            by_date[avail.date] = []
-        by_date[avail.date].append(avail)
+        entry = by_teacher.setdefault(avail.teacher_id, {"teacher": avail.teacher, "slots": []})
+        entry["slots"].append(avail)
+        by_date.setdefault(avail.date, []).append(avail)
 
     # Get dates where student has bookings (for disabling other slots on same date)
-    booked_dates = list(
-        Booking.objects.filter(student=request.user, availability__date__gte=today)
-        .values_list("availability__date", flat=True)
-        .distinct()
-    )
     booked_dates_iso = [d.isoformat() for d in booked_dates]
 
     context = {
         "has_completed_questionnaire": True,
         "availabilities_by_teacher": list(by_teacher.values()),
         "availabilities_by_date": by_date,
-        "has_slots": len(filtered_availabilities) > 0,
+        "has_slots": bool(by_date),
         "today": today,
         "tomorrow": tomorrow,
         "booked_dates": booked_dates_iso,
@@ -215,8 +229,8 @@ def cancel_booking(request, booking_id):
         # Store booking info for success message
         availability = booking.availability
         teacher_name = availability.teacher.get_full_name() or availability.teacher.email
-        date_str = availability.date.strftime("%B %d, %Y")
-        time_str = availability.start_time.strftime("%-I:%M %p")
+        date_str = availability.display_date
+        time_str = availability.display_time
         meeting_type = availability.get_meeting_type_display()
 
         # Attach cancellation message so notifications can use it
@@ -241,18 +255,12 @@ def cancel_booking(request, booking_id):
 
 @login_required
 def booking_ics(request, booking_id):
-    booking = get_object_or_404(
-        Booking.objects.select_related("availability", "availability__teacher", "student"),
-        id=booking_id,
-    )
     user = request.user
-    role = getattr(user, "role", "")
-    if not (
-        role == "admin"
-        or booking.student_id == user.id
-        or booking.availability.teacher_id == user.id
-    ):
-        return HttpResponseForbidden("You do not have permission to download this event.")
+    bookings = Booking.objects.select_related("availability", "availability__teacher", "student")
+    if getattr(user, "role", "") != "admin":
+        # Students and teachers only see their own bookings; anything else is a 404
+        bookings = bookings.filter(Q(student=user) | Q(availability__teacher=user))
+    booking = get_object_or_404(bookings, id=booking_id)
 
     ics_content = build_booking_ics(booking=booking)
     response = HttpResponse(ics_content, content_type="text/calendar")
@@ -198,6 +198,26 @@ DATABASES = {
 }
 
 
+# Cache
+# Defaults to per-process local memory. Set CACHE_URL (e.g. redis://127.0.0.1:6379/1)
+# when running several workers so cache invalidation is shared between them;
+# the Redis backend needs the `redis` package installed.
+_cache_url = os.getenv("CACHE_URL", "").strip()
+if _cache_url:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _cache_url,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -274,6 +294,17 @@ PASSWORD_RESET_TIMEOUT = int(timedelta(hours=24).total_seconds())
 
 TEACHER_ADMIN_FULL_PERMS = True
 
+# Opt-in: send notification emails from an in-process worker thread once the
+# triggering transaction commits, instead of on the request thread. Sends still
+# queued when the process restarts are lost, and failures are only logged
+# (see notifications.tasks).
+NOTIFICATIONS_SEND_ASYNC = os.getenv("NOTIFICATIONS_SEND_ASYNC", "False").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
 
 if ENV == "dev":
     EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.filebased.EmailBackend")
@@ -344,4 +375,5 @@ AVAILABILITY_SETTINGS = {
     "END_TIME": "23:00",  # End of available time slots (24-hour format)
     "SLOT_DURATION": 15,  # Duration of each time slot in minutes
     "MEETING_DURATION": 30,  # Duration of meetings in minutes (always 30)
+    "CALENDAR_CACHE_TIMEOUT": 300,  # Seconds to cache a teacher's month of calendar counts
 }
@@ -0,0 +1,8 @@
+from django.core.cache import cache
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Test rollbacks delete rows without signals, so cached pages and calendars would leak
+    cache.clear()
@@ -0,0 +1,25 @@
+"""
+Versioned cache keys shared by the apps.
+
+Cached entries embed the current version of their group in their key, so
+bumping the version invalidates the whole group without deleting anything.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def cache_version(key: str) -> int:
+    """
+    Current version stored under key, created on first use.
+
+    Versions are timestamps rather than counters, so a version key that was
+    evicted never comes back with a value an older cache entry was stored under.
+    """
+    return cache.get_or_set(key, time.time_ns, None)
+
+
+def bump_cache_version(key: str) -> None:
+    """Move key to a new version, orphaning every entry stored under the old one."""
+    cache.set(key, time.time_ns(), None)
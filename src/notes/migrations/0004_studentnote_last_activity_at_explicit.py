@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0003_studentnote_last_activity_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="studentnote",
+            name="last_activity_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0004_studentnote_last_activity_at_explicit"),
+        ("profiles", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="studentnote",
+            index=models.Index(
+                fields=["-last_activity_at", "-created_at"], name="notes_activity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentnote",
+            index=models.Index(
+                fields=["student_profile", "-last_activity_at", "-created_at"],
+                name="notes_profile_activity_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class StudentNote(models.Model):
@@ -26,12 +27,19 @@ class StudentNote(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    last_activity_at = models.DateTimeField(auto_now=True)
+    # Bumped explicitly when a comment is added, not on every save()
+    last_activity_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-last_activity_at", "-created_at"]
         indexes = [
             models.Index(fields=["student_profile", "created_at"]),
+            # Match the default ordering, globally and within one student's notes
+            models.Index(fields=["-last_activity_at", "-created_at"], name="notes_activity_idx"),
+            models.Index(
+                fields=["student_profile", "-last_activity_at", "-created_at"],
+                name="notes_profile_activity_idx",
+            ),
         ]
 
     def __str__(self):
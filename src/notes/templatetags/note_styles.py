@@ -0,0 +1,47 @@
+from django import template
+
+register = template.Library()
+
+# Card/badge classes for a note, keyed by the role of whoever wrote it
+_ADMIN_NOTE_STYLE = {
+    "card_class": (
+        "bg-amber-100 dark:bg-amber-500/20 ring-1 ring-amber-200 dark:ring-amber-400 "
+        "border border-amber-300 dark:border-amber-400 text-amber-950 dark:text-amber-50"
+    ),
+    "badge_class": "bg-amber-100 text-amber-800",
+    "badge_label": "Admin note",
+    "is_staff": True,
+}
+_TEACHER_NOTE_STYLE = {
+    "card_class": (
+        "bg-sky-50 dark:bg-sky-900/30 border border-sky-200 dark:border-sky-600 "
+        "text-slate-900 dark:text-slate-100"
+    ),
+    "badge_class": "bg-sky-100 text-sky-800",
+    "badge_label": "Advisor note",
+    "is_staff": True,
+}
+_STUDENT_NOTE_STYLE = {
+    "card_class": (
+        "bg-violet-50 dark:bg-violet-900/20 border border-violet-200 "
+        "dark:border-violet-600 text-violet-950 dark:text-violet-100"
+    ),
+    "badge_class": "bg-violet-100 text-violet-800",
+    "badge_label": "Student note",
+    "is_staff": False,
+}
+ROLE_STYLES = {
+    "admin": _ADMIN_NOTE_STYLE,
+    "teacher": _TEACHER_NOTE_STYLE,
+}
+
+
+@register.simple_tag
+def role_style(role):
+    """
+    Usage:
+      {% role_style note.created_by.role as style %}
+      <div class="{{ style.card_class }}">...</div>
+    Anything other than admin/teacher gets the student style.
+    """
+    return ROLE_STYLES.get(role, _STUDENT_NOTE_STYLE)
@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from notes.models import NoteComment, StudentNote
@@ -59,6 +61,48 @@ class NotesViewsTests(TestCase):
         self.assertEqual(comment.author, self.teacher)
         self.assertEqual(comment.note, note)
 
+    def test_only_comments_bump_note_last_activity(self):
+        note = StudentNote.objects.create(
+            student_profile=self.student.student_profile,
+            title="Plan",
+            body="Initial note",
+            created_by=self.student,
+        )
+        created_activity = note.last_activity_at
+
+        note.title = "Updated plan"
+        note.save()
+        note.refresh_from_db()
+        self.assertEqual(note.last_activity_at, created_activity)
+
+        self.client.login(email=self.teacher.email, password="pass1234")
+        url = reverse("notes:student_notes", args=[self.student.id])
+        self.client.post(url, {"action": "add_comment", "note_id": note.id, "body": "Feedback"})
+        note.refresh_from_db()
+        self.assertEqual(note.last_activity_at, NoteComment.objects.get().created_at)
+
+    def test_notes_page_query_count_does_not_grow_with_notes(self):
+        def add_note():
+            note = StudentNote.objects.create(
+                student_profile=self.student.student_profile,
+                body="Note",
+                created_by=self.teacher,
+                updated_by=self.student,
+            )
+            NoteComment.objects.create(note=note, author=self.student, body="Reply")
+
+        self.client.login(email=self.teacher.email, password="pass1234")
+        url = reverse("notes:student_notes", args=[self.student.id])
+        add_note()
+        with CaptureQueriesContext(connection) as one_note:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        add_note()
+        add_note()
+        with CaptureQueriesContext(connection) as three_notes:
+            response = self.client.get(url)
+        self.assertContains(response, "Reply", count=3)
+        self.assertEqual(len(three_notes), len(one_note))
+
     def test_student_selector_requires_staff(self):
         self.client.login(email=self.student.email, password="pass1234")
         url = reverse("notes:student_selector")
@@ -1,22 +1,42 @@
 from django.contrib import messages
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.shortcuts import get_object_or_404, redirect, render
 
 from profiles.models import StudentProfile
 from users.decorators import role_required
 
 from .forms import NoteCommentForm, StudentNoteForm
-from .models import StudentNote
+from .models import NoteComment, StudentNote
 
 User = get_user_model()
 
 
+_NOTE_USER_FIELDS = ("id", "role", "first_name", "last_name", "email")
+
+
 def _notes_for_profile(profile: StudentProfile):
+    # Only what student_notes.html renders; the profile itself comes from the view
+    comments = (
+        NoteComment.objects.select_related("author")
+        .only("id", "note", "body", "created_at", *(f"author__{f}" for f in _NOTE_USER_FIELDS))
+        .order_by("created_at")
+    )
     return (
         StudentNote.objects.filter(student_profile=profile)
-        .select_related("student_profile__user", "created_by", "updated_by")
-        .prefetch_related("comments__author")
+        # Served by notes_profile_activity_idx; spelled out so the page doesn't depend on Meta
+        .order_by("-last_activity_at", "-created_at")
+        .select_related("created_by", "updated_by")
+        .only(
+            "id",
+            "title",
+            "body",
+            "created_at",
+            *(f"created_by__{f}" for f in _NOTE_USER_FIELDS),
+            *(f"updated_by__{f}" for f in _NOTE_USER_FIELDS),
+        )
+        # A plain list per note, so the template doesn't clone a queryset per note
+        .prefetch_related(Prefetch("comments", queryset=comments, to_attr="ordered_comments"))
     )
 
 
@@ -37,7 +57,6 @@ def _handle_note_post(request, profile: StudentProfile):
             note.student_profile = profile
             note.created_by = request.user
             note.updated_by = request.user
-            note.last_activity_at = note.created_at
             note.save()
             messages.success(request, "Note added successfully.")
             return redirect(request.path), note_form, comment_form, comment_form_note_id
@@ -59,53 +78,13 @@ def _handle_note_post(request, profile: StudentProfile):
     return None, note_form, comment_form, comment_form_note_id
 
 
-@role_required(["student"])
-def my_notes(request):
-    profile = getattr(request.user, "student_profile", None)
-    if profile is None:
-        messages.error(request, "Student profile not found.")
-        return redirect("users:student_home")
-
+def _render_notes_page(request, profile: StudentProfile, *, is_staff_view: bool):
+    """Handle a notes POST for ``profile`` or render its notes page (shared by both roles)."""
     response, note_form, comment_form, comment_form_note_id = _handle_note_post(request, profile)
     if response:
         return response
 
-    notes_qs = _notes_for_profile(profile)
-    notes = list(notes_qs)
-    error_note_id = comment_form_note_id
-    admin_role = getattr(User.Roles, "ADMIN", "admin")
-    teacher_role = getattr(User.Roles, "TEACHER", "teacher")
-    for note in notes:
-        note.comment_has_error = error_note_id == note.id
-        creator_role = getattr(note.created_by, "role", "")
-        if creator_role == admin_role:
-            note.role_card_class = (
-                "bg-amber-100 dark:bg-amber-500/20 ring-1 ring-amber-200 dark:ring-amber-400 "
-                "border border-amber-300 dark:border-amber-400 text-amber-950 dark:text-amber-50"
-            )
-            note.role_icon_class = "text-amber-600"
-            note.role_icon_full_class = "h-4 w-4 text-amber-600"
-            note.role_badge_class = "bg-amber-100 text-amber-800"
-            note.role_badge_label = "Admin note"
-        elif creator_role == teacher_role:
-            note.role_card_class = (
-                "bg-sky-50 dark:bg-sky-900/30 border border-sky-200 dark:border-sky-600 "
-                "text-slate-900 dark:text-slate-100"
-            )
-            note.role_icon_class = "text-sky-600"
-            note.role_icon_full_class = "h-4 w-4 text-sky-600"
-            note.role_badge_class = "bg-sky-100 text-sky-800"
-            note.role_badge_label = "Advisor note"
-        else:
-            note.role_card_class = (
-                "bg-violet-50 dark:bg-violet-900/20 border border-violet-200 "
-                "dark:border-violet-600 text-violet-950 dark:text-violet-100"
-            )
-            note.role_icon_class = "text-violet-500"
-            note.role_icon_full_class = "h-4 w-4 text-violet-500"
-            note.role_badge_class = "bg-violet-100 text-violet-800"
-            note.role_badge_label = "Student note"
-        note.role_is_staff = creator_role in {admin_role, teacher_role}
+    notes = _notes_for_profile(profile)
 
     context = {
         "student_profile": profile,
@@ -114,18 +93,29 @@ def my_notes(request):
         "comment_form": comment_form,
         "blank_comment_form": NoteCommentForm(),
         "comment_form_note_id": comment_form_note_id,
-        "is_staff_view": False,
+        "is_staff_view": is_staff_view,
         "note_form_has_errors": bool(note_form.errors or note_form.non_field_errors()),
     }
     return render(request, "notes/student_notes.html", context)
 
 
+@role_required(["student"])
+def my_notes(request):
+    profile = getattr(request.user, "student_profile", None)
+    if profile is None:
+        messages.error(request, "Student profile not found.")
+        return redirect("users:student_home")
+
+    return _render_notes_page(request, profile, is_staff_view=False)
+
+
 @role_required(["teacher", "admin"])
 def student_selector(request):
     query = request.GET.get("q", "").strip()
+    # The selector only shows name and email; no need to join the profile
     students = (
         User.objects.filter(role=User.Roles.STUDENT)
-        .select_related("student_profile")
+        .only("id", "first_name", "last_name", "email")
         .order_by("last_name", "first_name")
     )
 
@@ -151,55 +141,4 @@ def student_notes(request, student_id):
         messages.error(request, "Notes are only available for student accounts.")
         return redirect("notes:student_selector")
 
-    response, note_form, comment_form, comment_form_note_id = _handle_note_post(request, profile)
-    if response:
-        return response
-
-    notes_qs = _notes_for_profile(profile)
-    notes = list(notes_qs)
-    error_note_id = comment_form_note_id
-    admin_role = getattr(User.Roles, "ADMIN", "admin")
-    teacher_role = getattr(User.Roles, "TEACHER", "teacher")
-    for note in notes:
-        note.comment_has_error = error_note_id == note.id
-        creator_role = getattr(note.created_by, "role", "")
-        if creator_role == admin_role:
-            note.role_card_class = (
-                "bg-amber-100 dark:bg-amber-500/20 ring-1 ring-amber-200 dark:ring-amber-400 "
-                "border border-amber-300 dark:border-amber-400 text-amber-950 dark:text-amber-50"
-            )
-            note.role_icon_class = "text-amber-600"
-            note.role_icon_full_class = "h-4 w-4 text-amber-600"
-            note.role_badge_class = "bg-amber-100 text-amber-800"
-            note.role_badge_label = "Admin note"
-        elif creator_role == teacher_role:
-            note.role_card_class = (
-                "bg-sky-50 dark:bg-sky-900/30 border border-sky-200 dark:border-sky-600 "
-                "text-slate-900 dark:text-slate-100"
-            )
-            note.role_icon_class = "text-sky-600"
-            note.role_icon_full_class = "h-4 w-4 text-sky-600"
-            note.role_badge_class = "bg-sky-100 text-sky-800"
-            note.role_badge_label = "Advisor note"
-        else:
-            note.role_card_class = (
-                "bg-violet-50 dark:bg-violet-900/20 border border-violet-200 "
-                "dark:border-violet-600 text-violet-950 dark:text-violet-100"
-            )
-            note.role_icon_class = "text-violet-500"
-            note.role_icon_full_class = "h-4 w-4 text-violet-500"
-            note.role_badge_class = "bg-violet-100 text-violet-800"
-            note.role_badge_label = "Student note"
-        note.role_is_staff = creator_role in {admin_role, teacher_role}
-
-    context = {
-        "student_profile": profile,
-        "notes": notes,
-        "note_form": note_form,
-        "comment_form": comment_form,
-        "blank_comment_form": NoteCommentForm(),
-        "comment_form_note_id": comment_form_note_id,
-        "is_staff_view": True,
-        "note_form_has_errors": bool(note_form.errors or note_form.non_field_errors()),
-    }
-    return render(request, "notes/student_notes.html", context)
+    return _render_notes_page(request, profile, is_staff_view=True)
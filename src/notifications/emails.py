@@ -3,31 +3,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import html
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 from django.urls import reverse
 
 from notifications.ics import build_booking_ics
 from users.utils import get_domain_and_scheme
 
 
-def admin_recipients() -> list[Recipient]:
-    User = get_user_model()
-    admins = User.objects.filter(role=getattr(User.Roles, "ADMIN", "admin")).only(
-        "email", "first_name", "last_name"
-    )
-    recipients: list[Recipient] = []
-    for admin in admins:
-        if admin.email:
-            recipients.append(Recipient(email=admin.email, name=admin.get_full_name()))
-    return recipients
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recipient:
     email: str
     name: str | None = None
@@ -38,27 +29,81 @@ class Recipient:
         return self.email
 
 
-def _send_email(
+User = get_user_model()
+ADMIN_ROLE = getattr(User.Roles, "ADMIN", "admin")
+
+ADMIN_RECIPIENTS_CACHE_KEY = "notifications:admin_recipients"
+ADMIN_RECIPIENTS_CACHE_TIMEOUT = 300  # Seconds; admin writes also invalidate it
+
+
+def _fetch_admin_recipients() -> list[Recipient]:
+    admins = User.objects.filter(role=ADMIN_ROLE).only("email", "first_name", "last_name")
+    recipients: list[Recipient] = []
+    for admin in admins:
+        if admin.email:
+            recipients.append(Recipient(email=admin.email, name=admin.get_full_name()))
+    return recipients
+
+
+def admin_recipients() -> list[Recipient]:
+    """Admins to copy on booking emails, cached since every booking change needs them."""
+    return cache.get_or_set(
+        ADMIN_RECIPIENTS_CACHE_KEY, _fetch_admin_recipients, ADMIN_RECIPIENTS_CACHE_TIMEOUT
+    )
+
+
+def invalidate_admin_recipients() -> None:
+    cache.delete(ADMIN_RECIPIENTS_CACHE_KEY)
+
+
+@functools.cache
+def _get_template(path: str):
+    """
+    Load and compile an email template once per process; None if it doesn't exist.
+
+    The configured loaders aren't wrapped in the cached loader, so without this
+    every send re-parses the .txt template and re-searches for the .html one.
+    """
+    try:
+        return get_template(path)
+    except TemplateDoesNotExist:
+        return None
+
+
+def _build_email(
     *,
     subject: str,
     template: str,
     context: dict,
     recipient: Recipient,
     attachments: list[tuple[str, str, str]] | None = None,
-):
-    """Render a notification template (txt + optional html) and send to a single recipient."""
+    sent_to: set[str] | None = None,
+) -> EmailMultiAlternatives | None:
+    """
+    Render a notification template (txt + optional html) into a message for one recipient.
+
+    Returns None when there is nothing to send. Pass the same ``sent_to`` set across
+    the messages of one notification to skip addresses that already got a copy.
+    """
     if not recipient or not recipient.email:
-        return
+        return None
+    if sent_to is not None:
+        address = recipient.email.lower()
+        if address in sent_to:
+            return None
+        sent_to.add(address)
 
     context = {"SITE_NAME": getattr(settings, "SITE_NAME", "Advising"), **context}
     context = {**context, "recipient": recipient}
-    txt_body = render_to_string(f"notifications/email/{template}.txt", context)
-    txt_body = html.unescape(txt_body)
-    html_path = f"notifications/email/{template}.html"
-    try:
-        html_body = render_to_string(html_path, context)
-    except Exception:
-        html_body = None
+    txt_template = _get_template(f"notifications/email/{template}.txt")
+    if txt_template is None:
+        raise TemplateDoesNotExist(f"notifications/email/{template}.txt")
+    txt_body = txt_template.render(context)
+    # Autoescaping turns quotes/ampersands in names into entities; only then unescape
+    if "&" in txt_body:
+        txt_body = html.unescape(txt_body)
+    html_template = _get_template(f"notifications/email/{template}.html")
+    html_body = html_template.render(context) if html_template else None
 
     msg = EmailMultiAlternatives(
         subject=subject,
@@ -71,7 +116,21 @@ def _send_email(
     if attachments:
         for filename, content, mimetype in attachments:
             msg.attach(filename, content, mimetype)
-    msg.send()
+    return msg
+
+
+def _send_email(**kwargs):
+    """Build and send a single notification email (see _build_email)."""
+    msg = _build_email(**kwargs)
+    if msg is not None:
+        msg.send()
+
+
+def _send_batch(messages) -> None:
+    """Send several notification emails over one connection, skipping empty slots."""
+    messages = [msg for msg in messages if msg is not None]
+    if messages:
+        get_connection().send_messages(messages)
 
 
 def send_booking_confirmation(*, booking):
@@ -88,40 +147,48 @@ def send_booking_confirmation(*, booking):
     ics_content = build_booking_ics(booking=booking)
     attachment = (f"booking-{booking.id}.ics", ics_content, "text/calendar")
 
-    student_recipient = Recipient(email=booking.student.email, name=booking.student.get_full_name())
-    _send_email(
-        subject="Booking confirmed",
-        template="booking_confirmation_student",
-        context={
-            **context,
-            "dashboard_url": f"{protocol}://{domain}{reverse('booking:book_meeting')}",
-        },
-        recipient=student_recipient,
-        attachments=[attachment],
-    )
-
+    student = booking.student
     advisor = booking.availability.teacher
-    advisor_recipient = Recipient(email=advisor.email, name=advisor.get_full_name())
-    _send_email(
-        subject="Booking confirmed",
-        template="booking_confirmation_advisor",
-        context={
-            **context,
-            "dashboard_url": f"{protocol}://{domain}{reverse('users:teacher_bookings')}",
-        },
-        recipient=advisor_recipient,
-        attachments=[attachment],
-    )
-
     admin_url = f"{protocol}://{domain}{reverse('availability:upcoming_availability')}"
-    for admin in admin_recipients():
-        _send_email(
+    # Student, then advisor, then admins: an advisor or student who is also an admin
+    # only gets their own (first) copy
+    sent_to: set[str] = set()
+    messages = [
+        _build_email(
             subject="Booking confirmed",
-            template="booking_confirmation_admin",
-            context={**context, "dashboard_url": admin_url},
-            recipient=admin,
+            template="booking_confirmation_student",
+            context={
+                **context,
+                "dashboard_url": f"{protocol}://{domain}{reverse('booking:book_meeting')}",
+            },
+            recipient=Recipient(email=student.email, name=student.get_full_name()),
             attachments=[attachment],
+            sent_to=sent_to,
+        ),
+        _build_email(
+            subject="Booking confirmed",
+            template="booking_confirmation_advisor",
+            context={
+                **context,
+                "dashboard_url": f"{protocol}://{domain}{reverse('users:teacher_bookings')}",
+            },
+            recipient=Recipient(email=advisor.email, name=advisor.get_full_name()),
+            attachments=[attachment],
+            sent_to=sent_to,
+        ),
+    ]
+    for admin in admin_recipients():
+        messages.append(
+            _build_email(
+                subject="Booking confirmed",
+                template="booking_confirmation_admin",
+                context={**context, "dashboard_url": admin_url},
+                recipient=admin,
+                attachments=[attachment],
+                sent_to=sent_to,
+            )
         )
+    _send_batch(messages)
 
 
 def send_booking_cancellation(*, booking, cancellation_message: str | None = None):
@@ -138,37 +205,45 @@ def send_booking_cancellation(*, booking, cancellation_message: str | None = Non
     }
     protocol = "https" if use_https else "http"
 
-    student_recipient = Recipient(email=booking.student.email, name=booking.student.get_full_name())
-    _send_email(
-        subject="Booking cancelled",
-        template="booking_cancellation_student",
-        context={
-            **context,
-            "dashboard_url": f"{protocol}://{domain}{reverse('booking:book_meeting')}",
-        },
-        recipient=student_recipient,
-    )
-
+    student = booking.student
     advisor = booking.availability.teacher
-    advisor_recipient = Recipient(email=advisor.email, name=advisor.get_full_name())
-    _send_email(
-        subject="Booking cancelled",
-        template="booking_cancellation_advisor",
-        context={
-            **context,
-            "dashboard_url": f"{protocol}://{domain}{reverse('users:teacher_bookings')}",
-        },
-        recipient=advisor_recipient,
-    )
-
     admin_url = f"{protocol}://{domain}{reverse('availability:upcoming_availability')}"
-    for admin in admin_recipients():
-        _send_email(
+    # Student, then advisor, then admins: an advisor or student who is also an admin
+    # only gets their own (first) copy
+    sent_to: set[str] = set()
+    messages = [
+        _build_email(
+            subject="Booking cancelled",
+            template="booking_cancellation_student",
+            context={
+                **context,
+                "dashboard_url": f"{protocol}://{domain}{reverse('booking:book_meeting')}",
+            },
+            recipient=Recipient(email=student.email, name=student.get_full_name()),
+            sent_to=sent_to,
+        ),
+        _build_email(
             subject="Booking cancelled",
-            template="booking_cancellation_admin",
-            context={**context, "dashboard_url": admin_url},
-            recipient=admin,
+            template="booking_cancellation_advisor",
+            context={
+                **context,
+                "dashboard_url": f"{protocol}://{domain}{reverse('users:teacher_bookings')}",
+            },
+            recipient=Recipient(email=advisor.email, name=advisor.get_full_name()),
+            sent_to=sent_to,
+        ),
+    ]
+    for admin in admin_recipients():
+        messages.append(
+            _build_email(
+                subject="Booking cancelled",
+                template="booking_cancellation_admin",
+                context={**context, "dashboard_url": admin_url},
+                recipient=admin,
+                sent_to=sent_to,
+            )
         )
+    _send_batch(messages)
 
 
 def send_student_note_notification(*, note):
@@ -1,45 +1,56 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, UTC
 
 from django.utils import timezone
 
+# RFC 5545: CRLF line endings, UTC timestamps, and TEXT values with \ ; , and
+# newlines escaped. Built once at import rather than per invite.
+_ICS_TEMPLATE = "\r\n".join(
+    [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Advising//EN",
+        "BEGIN:VEVENT",
+        "UID:booking-%(booking_id)s@advising",
+        "DTSTAMP:%(dtstamp)s",
+        "DTSTART:%(dtstart)s",
+        "DTEND:%(dtend)s",
+        "SUMMARY:%(summary)s",
+        "DESCRIPTION:%(description)s",
+        "END:VEVENT",
+        "END:VCALENDAR",
+        "",
+    ]
+)
+_UTC_STAMP = "%Y%m%dT%H%M%SZ"
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": None})
+
+
+def _utc_stamp(value: datetime) -> str:
+    return value.astimezone(UTC).strftime(_UTC_STAMP)
+
 
 def build_booking_ics(*, booking) -> str:
     slot = booking.availability
     start = timezone.make_aware(datetime.combine(slot.date, slot.start_time))
     end = timezone.make_aware(datetime.combine(slot.date, slot.end_time))
 
-    summary = f"Session with {slot.teacher.get_full_name() or slot.teacher.email}"
-    description_lines = [
-        f"Student: {booking.student.get_full_name() or booking.student.email}",
-        f"Advisor: {slot.teacher.get_full_name() or slot.teacher.email}",
-    ]
+    advisor_name = slot.teacher.get_full_name() or slot.teacher.email
+    description = (
+        f"Student: {booking.student.get_full_name() or booking.student.email}\n"
+        f"Advisor: {advisor_name}"
+    )
     if slot.message:
-        description_lines.append(f"Advisor note: {slot.message}")
+        description += f"\nAdvisor note: {slot.message}"
     if booking.message:
-        description_lines.append(f"Student note: {booking.message}")
-
-    description = "\\n".join(description_lines)
-
-    ics = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Advising//EN
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{dtstamp}
-DTSTART:{dtstart}
-DTEND:{dtend}
-SUMMARY:{summary}
-DESCRIPTION:{description}
-END:VEVENT
-END:VCALENDAR
-"""
-    return ics.format(
-        uid=f"booking-{booking.id}@advising",
-        dtstamp=timezone.now().strftime("%Y%m%dT%H%M%SZ"),
-        dtstart=start.strftime("%Y%m%dT%H%M%SZ"),
-        dtend=end.strftime("%Y%m%dT%H%M%SZ"),
-        summary=summary,
-        description=description,
-    )
+        description += f"\nStudent note: {booking.message}"
+
+    return _ICS_TEMPLATE % {
+        "booking_id": booking.id,
+        "dtstamp": _utc_stamp(timezone.now()),
+        "dtstart": _utc_stamp(start),
+        "dtend": _utc_stamp(end),
+        "summary": f"Session with {advisor_name}".translate(_TEXT_ESCAPES),
+        "description": description.translate(_TEXT_ESCAPES),
+    }
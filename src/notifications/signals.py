@@ -1,37 +1,62 @@
 from __future__ import annotations
 
-from django.db.models.signals import post_save, pre_delete
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from booking.models import Booking
 from notes.models import NoteComment, StudentNote
 from notifications import emails
+from notifications.tasks import send_on_commit
 
+User = get_user_model()
 
-@receiver(post_save, sender=Booking)
+# Changes to these can add, drop or rename a cached admin recipient
+_ADMIN_RECIPIENT_FIELDS = frozenset({"role", "email", "first_name", "last_name"})
+
+
+@receiver(post_save, sender=Booking, dispatch_uid="notifications.booking_created")
 def booking_created(sender, instance: Booking, created: bool, **kwargs):
     if not created:
         return
-    emails.send_booking_confirmation(booking=instance)
+    send_on_commit(emails.send_booking_confirmation, booking=instance)
 
 
-@receiver(pre_delete, sender=Booking)
+@receiver(pre_delete, sender=Booking, dispatch_uid="notifications.booking_deleted")
 def booking_deleted(sender, instance: Booking, **kwargs):
+    # The email goes out after the row (and possibly its slot or student) is gone,
+    # so load everything the templates read while it still exists
+    instance.student
+    instance.availability.teacher
     reason = getattr(instance, "cancellation_message", "")
-    emails.send_booking_cancellation(booking=instance, cancellation_message=reason)
+    send_on_commit(emails.send_booking_cancellation, booking=instance, cancellation_message=reason)
 
 
-@receiver(post_save, sender=StudentNote)
+@receiver(post_save, sender=StudentNote, dispatch_uid="notifications.note_created")
 def note_created(sender, instance: StudentNote, created: bool, **kwargs):
     if not created:
         return
-    emails.send_student_note_notification(note=instance)
-    emails.send_student_note_confirmation(note=instance)
+    send_on_commit(emails.send_student_note_notification, note=instance)
+    send_on_commit(emails.send_student_note_confirmation, note=instance)
 
 
-@receiver(post_save, sender=NoteComment)
+@receiver(post_save, sender=NoteComment, dispatch_uid="notifications.note_comment_created")
 def note_comment_created(sender, instance: NoteComment, created: bool, **kwargs):
     if not created:
         return
-    emails.send_note_comment_notification(comment=instance)
-    emails.send_note_comment_confirmation(comment=instance)
+    send_on_commit(emails.send_note_comment_notification, comment=instance)
+    send_on_commit(emails.send_note_comment_confirmation, comment=instance)
+
+
+@receiver(post_save, sender=User, dispatch_uid="notifications.user_saved")
+def user_saved(sender, instance, update_fields=None, **kwargs):
+    # A role change away from admin is invisible on the instance, so any full save
+    # invalidates; partial saves like the last_login bump on every login don't
+    if update_fields is None or _ADMIN_RECIPIENT_FIELDS.intersection(update_fields):
+        emails.invalidate_admin_recipients()
+
+
+@receiver(post_delete, sender=User, dispatch_uid="notifications.user_deleted")
+def user_deleted(sender, instance, **kwargs):
+    if instance.role == emails.ADMIN_ROLE:
+        emails.invalidate_admin_recipients()
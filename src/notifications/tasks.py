@@ -0,0 +1,44 @@
+"""
+Deferred delivery of notification emails.
+
+Signal handlers (notifications and user invites) hand their sends to
+``send_on_commit`` so nothing goes out for a transaction that rolls back. With
+``NOTIFICATIONS_SEND_ASYNC`` enabled the SMTP round-trips then run on a small
+worker pool instead of the request thread.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notifications")
+
+
+def _send(send, args, kwargs):
+    # The triggering row is already committed, so a failed send must not fail the request
+    try:
+        send(*args, **kwargs)
+    except Exception:
+        logger.exception("Sending notification %s failed", send.__name__)
+
+
+def _run(send, args, kwargs):
+    try:
+        _send(send, args, kwargs)
+    finally:
+        # Queries made from the worker open thread-local connections; close them
+        connections.close_all()
+
+
+def send_on_commit(send, /, *args, **kwargs):
+    """Call ``send(*args, **kwargs)`` once the current transaction commits."""
+    if getattr(settings, "NOTIFICATIONS_SEND_ASYNC", False):
+        transaction.on_commit(lambda: _executor.submit(_run, send, args, kwargs))
+    else:
+        transaction.on_commit(lambda: _send(send, args, kwargs))
@@ -1,13 +1,22 @@
 import datetime
+import threading
 
 import pytest
 
 from availability.models import Availability
 from booking.models import Booking
 from notes.models import NoteComment, StudentNote
+from notifications.emails import _get_template, admin_recipients
+from notifications.tasks import send_on_commit
 from users.models import User
 
 
+@pytest.fixture(autouse=True)
+def send_notifications_inline(settings):
+    # Deliver on commit but on the test thread, so mailoutbox sees the messages
+    settings.NOTIFICATIONS_SEND_ASYNC = False
+
+
 @pytest.fixture
 @pytest.mark.django_db
 def admin_user():
@@ -46,7 +55,6 @@ def availability(teacher_user):
         teacher=teacher_user,
         date=datetime.date.today() + datetime.timedelta(days=1),
         start_time=datetime.time(9, 0),
-        end_time=datetime.time(9, 30),
         meeting_type=Availability.MeetingType.ONLINE,
         message="Bring notebook",
     )
@@ -54,44 +62,74 @@ def availability(teacher_user):
 
 @pytest.mark.django_db
 def test_booking_creation_sends_notifications(
-    admin_user, teacher_user, student_user, availability, mailoutbox
+    admin_user,
+    teacher_user,
+    student_user,
+    availability,
+    mailoutbox,
+    django_capture_on_commit_callbacks,
 ):
-    Booking.objects.create(availability=availability, student=student_user, message="Need help")
+    with django_capture_on_commit_callbacks(execute=True):
+        Booking.objects.create(availability=availability, student=student_user, message="Need help")
     assert len(mailoutbox) == 3  # student, advisor, admin
     subjects = {message.subject for message in mailoutbox}
     assert "Booking confirmed" in subjects
 
 
+@pytest.mark.django_db
+def test_booking_emails_each_address_once(
+    admin_user, student_user, mailoutbox, django_capture_on_commit_callbacks
+):
+    # An admin running their own slot gets the advisor copy, not a second admin one
+    slot = Availability.objects.create(
+        teacher=admin_user,
+        date=datetime.date.today() + datetime.timedelta(days=1),
+        start_time=datetime.time(11, 0),
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        Booking.objects.create(availability=slot, student=student_user)
+    assert sorted(message.to[0] for message in mailoutbox) == [
+        "admin@example.com",
+        "student@example.com",
+    ]
+
+
 @pytest.mark.django_db
 def test_booking_cancellation_sends_notifications(
-    admin_user, student_user, availability, mailoutbox
+    admin_user, student_user, availability, mailoutbox, django_capture_on_commit_callbacks
 ):
     booking = Booking.objects.create(availability=availability, student=student_user)
     reason = "Need to reschedule"
     booking.cancellation_message = reason
     mailoutbox.clear()
-    booking.delete()
+    with django_capture_on_commit_callbacks(execute=True):
+        booking.delete()
     assert len(mailoutbox) == 3
     assert any(message.subject == "Booking cancelled" for message in mailoutbox)
     assert all(reason in message.body for message in mailoutbox)
 
 
 @pytest.mark.django_db
-def test_note_creation_notifies_student_and_author(teacher_user, student_user, mailoutbox):
-    StudentNote.objects.create(
-        student_profile=student_user.student_profile,
-        title="Plan",
-        body="We will review goals",
-        created_by=teacher_user,
-        updated_by=teacher_user,
-    )
+def test_note_creation_notifies_student_and_author(
+    teacher_user, student_user, mailoutbox, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        StudentNote.objects.create(
+            student_profile=student_user.student_profile,
+            title="Plan",
+            body="We will review goals",
+            created_by=teacher_user,
+            updated_by=teacher_user,
+        )
     assert len(mailoutbox) == 2
     subjects = sorted(message.subject for message in mailoutbox)
     assert subjects == ["New advisor note", "Your note was sent"]
 
 
 @pytest.mark.django_db
-def test_note_comment_notifications(teacher_user, student_user, mailoutbox):
+def test_note_comment_notifications(
+    teacher_user, student_user, mailoutbox, django_capture_on_commit_callbacks
+):
     note = StudentNote.objects.create(
         student_profile=student_user.student_profile,
         title="Plan",
@@ -100,7 +138,61 @@ def test_note_comment_notifications(teacher_user, student_user, mailoutbox):
         updated_by=teacher_user,
     )
     mailoutbox.clear()
-    NoteComment.objects.create(note=note, author=teacher_user, body="Looking forward")
+    with django_capture_on_commit_callbacks(execute=True):
+        NoteComment.objects.create(note=note, author=teacher_user, body="Looking forward")
     assert len(mailoutbox) == 2
     subjects = sorted(message.subject for message in mailoutbox)
     assert subjects == ["New comment on your note", "Your comment was sent"]
+
+
+@pytest.mark.django_db
+def test_notifications_wait_for_commit(teacher_user, student_user, mailoutbox):
+    StudentNote.objects.create(
+        student_profile=student_user.student_profile,
+        body="Rolled back with the test transaction",
+        created_by=teacher_user,
+    )
+    assert mailoutbox == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_send_on_commit_runs_on_worker_thread_when_async(settings):
+    settings.NOTIFICATIONS_SEND_ASYNC = True
+    sent = threading.Event()
+    threads = []
+
+    def send(**kwargs):
+        threads.append((threading.current_thread(), kwargs))
+        sent.set()
+
+    # Outside any transaction on_commit runs the callback immediately
+    send_on_commit(send, note="n")
+
+    assert sent.wait(timeout=5)
+    assert threads[0][0] is not threading.current_thread()
+    assert threads[0][1] == {"note": "n"}
+
+
+def test_email_templates_are_compiled_once():
+    path = "notifications/email/booking_confirmation_student.txt"
+    assert _get_template(path) is _get_template(path)
+    # Optional html alternatives that don't exist are remembered as missing
+    assert _get_template("notifications/email/booking_confirmation_student.html") is None
+
+
+@pytest.mark.django_db
+def test_admin_recipients_are_cached_until_an_admin_changes(
+    admin_user, teacher_user, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        assert [r.email for r in admin_recipients()] == ["admin@example.com"]
+        assert [r.email for r in admin_recipients()] == ["admin@example.com"]
+
+    # Logins only touch last_login and keep the cache
+    admin_user.save(update_fields=["last_login"])
+    with django_assert_num_queries(0):
+        admin_recipients()
+
+    admin_user.role = User.Roles.TEACHER
+    admin_user.save()
+    assert admin_recipients() == []
@@ -11,19 +11,13 @@ from .models import StudentProfile
 User = get_user_model()
 
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid="profiles.create_student_profile")
 def create_student_profile(sender, instance, created, **kwargs):
     """
     Automatically create a StudentProfile when a new student user is created.
-    """
-    if created and instance.role == "student":
-        StudentProfile.objects.create(user=instance)
-
 
-@receiver(post_save, sender=User)
-def save_student_profile(sender, instance, **kwargs):
+    Later user saves leave the profile alone; nothing on it mirrors the user.
+    get_or_create keeps a repeated created=True dispatch from failing.
     """
-    Save the StudentProfile when the user is saved.
-    """
-    if instance.role == "student" and hasattr(instance, "student_profile"):
-        instance.student_profile.save()
+    if created and instance.role == "student":
+        StudentProfile.objects.get_or_create(user=instance)
@@ -13,13 +13,13 @@ class QuestionnaireForm(forms.ModelForm):
     Form for students to complete their questionnaire.
     """
 
-    LANGUAGE_GOALS_CHOICES = [
+    LANGUAGE_GOALS_CHOICES = (
         ("personal_interest", "Personal or general interest"),
         ("fieldwork", "Fieldwork (oral communicative purposes)"),
         ("academic_reading", "Academic reading or other scholarship"),
         ("study_abroad", "Preparation for work or study abroad"),
         ("other", "Other"),
-    ]
+    )
 
     language_mandatory_goals = forms.MultipleChoiceField(
         choices=LANGUAGE_GOALS_CHOICES,
@@ -115,20 +115,6 @@ class QuestionnaireForm(forms.ModelForm):
             "additional_comments": "Additional comments",
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Remove the blank choice for required fields
-        self.fields["university_status"].choices = [
-            c for c in self.fields["university_status"].choices if c[0] != ""
-        ]
-        self.fields["language_mandatory_proficiency"].choices = [
-            c for c in self.fields["language_mandatory_proficiency"].choices if c[0] != ""
-        ]
-        self.fields["language_optional_proficiency"].choices = [
-            c for c in self.fields["language_optional_proficiency"].choices if c[0] != ""
-        ]
-
     def clean_language_mandatory_goals(self):
         """Ensure at least one learning goal is selected for mandatory language."""
         data = self.cleaned_data.get("language_mandatory_goals")
@@ -138,10 +124,8 @@ class QuestionnaireForm(forms.ModelForm):
 
     def clean_other_languages_studied(self):
         """Set default value if not specified."""
-        data = self.cleaned_data.get("other_languages_studied")
-        if not data or not data.strip():
-            return "Not specified"
-        return data
+        # Form CharFields strip whitespace already, so blank input arrives as ""
+        return self.cleaned_data.get("other_languages_studied") or "Not specified"
 
     def clean(self):
         """Additional validation for optional language fields."""
@@ -152,7 +136,7 @@ class QuestionnaireForm(forms.ModelForm):
         optional_goals = cleaned_data.get("language_optional_goals")
 
         # If optional language name is provided, require proficiency and goals
-        if optional_name and optional_name.strip():
+        if optional_name:  # already stripped by the form field
             if not optional_proficiency:
                 self.add_error(
                     "language_optional_proficiency",
@@ -165,3 +149,23 @@ class QuestionnaireForm(forms.ModelForm):
                 )
 
         return cleaned_data
+
+
+def _drop_blank_choices(form_class, *field_names):
+    """
+    Remove the blank choice from radio-rendered fields once, on the class.
+
+    Form instances deep-copy base_fields, so every instance starts with the
+    filtered choices without rebuilding them in __init__.
+    """
+    for name in field_names:
+        field = form_class.base_fields[name]
+        field.choices = [c for c in field.choices if c[0] != ""]
+
+
+_drop_blank_choices(
+    QuestionnaireForm,
+    "university_status",
+    "language_mandatory_proficiency",
+    "language_optional_proficiency",
+)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0001_initial"),
+        ("questionnaire", "0002_alter_questionnaire_university_status"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="questionnaire",
+            index=models.Index(
+                fields=["student_profile", "-created_at"], name="quest_profile_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="questionnaire",
+            index=models.Index(
+                fields=["student_profile", "completed", "-created_at"],
+                name="quest_profile_completed_idx",
+            ),
+        ),
+    ]
@@ -35,7 +35,7 @@ class Questionnaire(models.Model):
         ),
     )
 
-    UNIVERSITY_STATUS_CHOICES = [
+    UNIVERSITY_STATUS_CHOICES = (
         ("undergrad_first", "Undergraduate student (1st Year)"),
         ("undergrad_other", "Undergraduate student (Other Years)"),
         ("mphil", "MPhil student"),
@@ -47,7 +47,7 @@ class Questionnaire(models.Model):
         ("fee_paying", "Fee-paying member"),
         ("academic_visitor", "Academic visitor"),
         ("other", "Other"),
-    ]
+    )
 
     university_status = models.CharField(
         max_length=50,
@@ -58,11 +58,11 @@ class Questionnaire(models.Model):
     )
 
     # Language Learning - Mandatory
-    LANGUAGE_PROFICIENCY_CHOICES = [
+    LANGUAGE_PROFICIENCY_CHOICES = (
         ("beginner", "Beginner"),
         ("intermediate", "Intermediate"),
         ("advanced", "Advanced"),
-    ]
+    )
 
     language_mandatory_name = models.CharField(
         max_length=100,
@@ -160,3 +160,14 @@ class Questionnaire(models.Model):
         verbose_name = "Questionnaire"
         verbose_name_plural = "Questionnaires"
         ordering = ["-created_at"]
+        indexes = [
+            # A student's submissions newest first (questionnaire page)
+            models.Index(
+                fields=["student_profile", "-created_at"], name="quest_profile_created_idx"
+            ),
+            # has_completed_questionnaire() and completed-only listings
+            models.Index(
+                fields=["student_profile", "completed", "-created_at"],
+                name="quest_profile_completed_idx",
+            ),
+        ]
@@ -7,6 +7,8 @@ from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 
+from profiles.models import StudentProfile
+
 from .forms import QuestionnaireForm
 
 
@@ -22,14 +24,15 @@ def questionnaire_view(request, student_id=None):
         if request.user.role not in ("teacher", "admin"):
             return HttpResponseForbidden("Not allowed")
 
-        from django.contrib.auth import get_user_model
-
-        User = get_user_model()
-        student = get_object_or_404(User, id=student_id, role="student")
-        student_profile = getattr(student, "student_profile", None)
-
-        if not student_profile:
-            return render(request, "404.html", status=404)
+        # One query for the student and their profile; no profile is a 404 too
+        student_profile = get_object_or_404(
+            StudentProfile.objects.select_related("user").only(
+                "id", "user__id", "user__email", "user__first_name", "user__last_name", "user__role"
+            ),
+            user_id=student_id,
+            user__role="student",
+        )
+        student = student_profile.user
 
         is_owner = False
         is_editing = False  # staff cannot edit
@@ -46,16 +49,19 @@ def questionnaire_view(request, student_id=None):
         is_owner = True
         is_editing = request.GET.get("edit", "false").lower() == "true"
 
+    # Every submission, newest first, in one query; latest, completed ones and
+    # the completion flag all come from this list
+    all_questionnaires = list(student_profile.questionnaires.order_by("-created_at"))
+    latest_questionnaire = all_questionnaires[0] if all_questionnaires else None
+    completed_questionnaires = [q for q in all_questionnaires if q.completed]
+
     # Check if student has completed questionnaire
-    has_completed = student_profile.has_completed_questionnaire()
+    has_completed = bool(completed_questionnaires)
 
     # Force edit if owner has never completed
     if is_owner and not has_completed:
         is_editing = True
 
-    # Get latest questionnaire
-    latest_questionnaire = student_profile.questionnaires.order_by("-created_at").first()
-
     if request.method == "POST" and is_owner and is_editing:
         form = QuestionnaireForm(request.POST)
         if form.is_valid():
@@ -77,9 +83,7 @@ def questionnaire_view(request, student_id=None):
             "is_editing": is_editing,
             "student": student,
             "latest_questionnaire": latest_questionnaire,
-            "questionnaires": student_profile.questionnaires.filter(completed=True).order_by(
-                "-created_at"
-            ),
+            "questionnaires": completed_questionnaires,
             "has_completed_questionnaire": has_completed,
             "is_owner": is_owner,
         },
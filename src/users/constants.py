@@ -1,15 +1,20 @@
 # src/users/constants.py
+from types import MappingProxyType
 
 # Password reset template paths used by users.views.*
 # All files live under users/templates/users/registration/
-PWD_RESET_TPLS = {
-    # Web pages
-    "form": "users/registration/password_reset_form.html",
-    "done": "users/registration/password_reset_done.html",
-    "confirm": "users/registration/password_reset_confirm.html",
-    "complete": "users/registration/password_reset_complete.html",
-    # Emails
-    "email_txt": "users/registration/password_reset_email.txt",
-    "email_html": "users/registration/password_reset_email.html",  # present
-    "subject": "users/registration/password_reset_subject.txt",
-}
+# Read-only: the view classes copy these at import, so a later change would
+# only reach some callers.
+PWD_RESET_TPLS = MappingProxyType(
+    {
+        # Web pages
+        "form": "users/registration/password_reset_form.html",
+        "done": "users/registration/password_reset_done.html",
+        "confirm": "users/registration/password_reset_confirm.html",
+        "complete": "users/registration/password_reset_complete.html",
+        # Emails
+        "email_txt": "users/registration/password_reset_email.txt",
+        "email_html": "users/registration/password_reset_email.html",  # present
+        "subject": "users/registration/password_reset_subject.txt",
+    }
+)
@@ -24,12 +24,21 @@ class RegisterForm(DjangoUserCreationForm):
 
 
 # --- Profile update form (for logged-in users) ------------------------------
+EMAIL_IN_USE_MESSAGE = "This email address is already in use."
+
+
 class ProfileUpdateForm(forms.ModelForm):
-    """Form for users to update their own profile information."""
+    """
+    Form for users to update their own profile information.
+
+    Email uniqueness (excluding the current user) comes from the model's
+    unique=True through ModelForm.validate_unique(); no separate clean_email.
+    """
 
     class Meta:
         model = User
         fields = ("first_name", "last_name", "email")
+        error_messages = {"email": {"unique": EMAIL_IN_USE_MESSAGE}}
         widgets = {
             "first_name": forms.TextInput(
                 attrs={
@@ -69,13 +78,6 @@ class ProfileUpdateForm(forms.ModelForm):
             ),
         }
 
-    def clean_email(self):
-        """Ensure email is unique, excluding the current user."""
-        email = self.cleaned_data.get("email")
-        if User.objects.exclude(pk=self.instance.pk).filter(email=email).exists():
-            raise forms.ValidationError("This email address is already in use.")
-        return email
-
 
 # --- Admin-only forms (Unfold-styled) ---------------------------------------
 class AdminUserAddForm(UnfoldUserCreationForm):
@@ -12,8 +12,8 @@ class Command(BaseCommand):
     help = "Remove is_staff flag from all teacher users (admins only should have admin access)"
 
     def handle(self, *args, **options):
-        teachers = User.objects.filter(role=User.Roles.TEACHER, is_staff=True)
-        count = teachers.count()
+        # update() returns the number of rows changed, so no separate count() is needed
+        count = User.objects.filter(role=User.Roles.TEACHER, is_staff=True).update(is_staff=False)
 
         if count == 0:
             self.stdout.write(
@@ -21,9 +21,6 @@ class Command(BaseCommand):
             )
             return
 
-        # Update all teachers to remove staff access
-        teachers.update(is_staff=False)
-
         self.stdout.write(
             self.style.SUCCESS(f"✓ Successfully removed staff access from {count} teacher(s)")
         )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-14 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["role", "last_name", "first_name"], name="users_role_name_idx"
+            ),
+        ),
+    ]
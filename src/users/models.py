@@ -82,6 +82,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []  # email + password only
 
+    class Meta:
+        indexes = [
+            # Role-filtered name listings (notes student selector) sort by surname
+            models.Index(fields=["role", "last_name", "first_name"], name="users_role_name_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
@@ -1,11 +1,12 @@
 # src/users/signals.py
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.db import transaction
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
-from .utils import get_domain_and_scheme, send_invite_email
+from notifications.tasks import send_on_commit
+
+from .utils import get_domain_and_scheme, invalidate_user_list_cache, send_invite_email
 
 User = get_user_model()
 TEACHER_GROUP_NAME = "Teacher Admin"
@@ -14,7 +15,7 @@ TEACHER_GROUP_NAME = "Teacher Admin"
 # -------------------------------
 # Invite email after user create
 # -------------------------------
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid="users.send_invite_on_create")
 def send_invite_on_create(sender, instance, created: bool, **kwargs):
     """
     When a new user is created without a usable password,
@@ -27,12 +28,29 @@ def send_invite_on_create(sender, instance, created: bool, **kwargs):
     if instance.is_superuser or instance.has_usable_password():
         return
 
-    def _send():
-        domain, use_https = get_domain_and_scheme(None)
-        send_invite_email(instance, domain=domain, use_https=use_https)
+    # Run only after DB commit so uid/token are valid, and (like the notification
+    # emails) off the request thread so creating a user doesn't wait on SMTP.
+    domain, use_https = get_domain_and_scheme(None)
+    send_on_commit(send_invite_email, instance, domain=domain, use_https=use_https)
 
-    # Run only after DB commit so uid/token are valid.
-    transaction.on_commit(_send)
+
+# -------------------------------
+# Student/teacher list cache
+# -------------------------------
+@receiver(post_save, sender=User, dispatch_uid="users.user_list_changed")
+@receiver(post_delete, sender=User, dispatch_uid="users.user_list_changed")
+@receiver(
+    post_save, sender="questionnaire.Questionnaire", dispatch_uid="users.questionnaire_changed"
+)
+@receiver(
+    post_delete, sender="questionnaire.Questionnaire", dispatch_uid="users.questionnaire_changed"
+)
+def user_list_changed(sender, update_fields=None, **kwargs):
+    """Drop the cached list pages; they show user fields and questionnaire completion."""
+    # Logging in saves only last_login, which the lists don't show
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    invalidate_user_list_cache()
 
 
 # -------------------------------
@@ -40,18 +58,14 @@ def send_invite_on_create(sender, instance, created: bool, **kwargs):
 # -------------------------------
 
 
-@receiver(post_migrate)
+@receiver(post_migrate, dispatch_uid="users.ensure_teacher_admin_group")
 def ensure_teacher_admin_group(sender, **kwargs):
     """
     Ensure Teacher Admin group exists for potential future use.
     Teachers no longer get Django admin access (is_staff=False).
     """
+    # post_migrate is sent once per installed app; only act for this one
+    if sender.name != "users":
+        return
     # Create the group but don't assign any special permissions or staff status
     Group.objects.get_or_create(name=TEACHER_GROUP_NAME)
-
-
-# Connect after migrations (use a stable dispatch_uid to avoid double-wiring)
-post_migrate.connect(
-    ensure_teacher_admin_group,
-    dispatch_uid="users.ensure_teacher_admin_group",
-)
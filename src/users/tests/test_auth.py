@@ -3,9 +3,12 @@
 # Purpose: End-to-end tests for login/logout and role-based redirects.
 
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 from django.urls import reverse
 import pytest
 
+from questionnaire.models import Questionnaire
+
 User = get_user_model()
 
 
@@ -72,3 +75,36 @@ def test_logout_renders_logged_out_page(client):
     resp = client.post(reverse("users:logout"))
     assert resp.status_code == 200
     assert b"logged out" in resp.content.lower() or b"signed out" in resp.content.lower()
+
+
+@pytest.mark.django_db
+@override_settings(FORCE_QUESTIONNAIRE_COMPLETION=True)
+def test_login_sends_student_to_questionnaire_until_completed(client):
+    """
+    GIVEN FORCE_QUESTIONNAIRE_COMPLETION is on
+    WHEN a student logs in before and after completing a questionnaire
+    THEN they land on the questionnaire first, and on their home page after
+    """
+    user = User.objects.create_user(email="quest@ex.com", password="pass1234", role="student")
+    login_url = reverse("users:login")
+    credentials = {"username": user.email, "password": "pass1234"}
+
+    resp = client.post(login_url, credentials)
+    assert resp.url == reverse("questionnaire:questionnaire")
+
+    Questionnaire.objects.create(
+        student_profile=user.student_profile,
+        faculty_department="Languages",
+        mother_tongue="English",
+        university_status="other",
+        language_mandatory_name="French",
+        language_mandatory_proficiency="beginner",
+        language_mandatory_goals=["other"],
+        aspects_to_improve="Listening",
+        activities_you_can_manage="Reading",
+        hours_per_week="2",
+        completed=True,
+    )
+    client.logout()
+    resp = client.post(login_url, credentials)
+    assert resp.url == reverse("users:student_home")
@@ -1,7 +1,10 @@
 # src/users/tests/test_models.py
 from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
 import pytest
 
+from profiles.models import StudentProfile
+
 User = get_user_model()
 
 
@@ -37,3 +40,34 @@ def test_create_superuser_defaults_to_admin_role():
     assert su.is_superuser is True
     # role should default to ADMIN
     assert su.role == User.Roles.ADMIN
+
+
+@pytest.mark.django_db
+def test_student_profile_created_once_and_not_resaved(django_assert_num_queries):
+    """
+    New students get a StudentProfile; later user saves touch only the user row.
+    """
+    u = User.objects.create_user(email="s@example.com", password="pass1234", role="student")
+    profile = u.student_profile
+
+    with django_assert_num_queries(1):
+        u.first_name = "Sam"
+        u.save()
+
+    profile.refresh_from_db()
+    assert profile.user_id == u.pk
+
+
+@pytest.mark.django_db
+def test_repeated_student_created_signal_keeps_one_profile():
+    """
+    Re-dispatching post_save with created=True for a student should not
+    fail or create a second StudentProfile.
+    """
+    student = User.objects.create_user(
+        email="signal-student@example.com", password="pass1234", role="student"
+    )
+
+    post_save.send(sender=User, instance=student, created=True)
+
+    assert StudentProfile.objects.filter(user=student).count() == 1
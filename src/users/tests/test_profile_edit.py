@@ -0,0 +1,40 @@
+# src/users/tests/test_profile_edit.py
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+import pytest
+
+from users.forms import EMAIL_IN_USE_MESSAGE
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_profile_edit_rejects_another_users_email(client):
+    User.objects.create_user(email="taken@example.com", password="pass1234")
+    user = User.objects.create_user(email="me@example.com", password="pass1234")
+    client.force_login(user)
+
+    response = client.post(
+        reverse("users:profile_edit"),
+        {"first_name": "Me", "last_name": "", "email": "taken@example.com"},
+    )
+
+    assert response.status_code == 200
+    assert response.context["form"].errors["email"] == [EMAIL_IN_USE_MESSAGE]
+    user.refresh_from_db()
+    assert user.email == "me@example.com"
+
+
+@pytest.mark.django_db
+def test_profile_edit_keeps_own_email(client):
+    user = User.objects.create_user(email="me@example.com", password="pass1234")
+    client.force_login(user)
+
+    response = client.post(
+        reverse("users:profile_edit"),
+        {"first_name": "Me", "last_name": "Too", "email": "me@example.com"},
+    )
+
+    assert response.status_code == 302
+    user.refresh_from_db()
+    assert user.get_full_name() == "Me Too"
@@ -0,0 +1,97 @@
+# src/users/tests/test_student_list.py
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+import pytest
+
+from questionnaire.models import Questionnaire
+
+User = get_user_model()
+
+
+def _complete_questionnaire(student):
+    Questionnaire.objects.create(
+        student_profile=student.student_profile,
+        faculty_department="Languages",
+        mother_tongue="English",
+        university_status="other",
+        language_mandatory_name="French",
+        language_mandatory_proficiency="beginner",
+        language_mandatory_goals=["other"],
+        aspects_to_improve="Listening",
+        activities_you_can_manage="Reading",
+        hours_per_week="2",
+        completed=True,
+    )
+
+
+@pytest.mark.django_db
+def test_student_list_sorts_by_questionnaire_in_one_query(client, django_assert_num_queries):
+    teacher = User.objects.create_user(email="t@example.com", password="pass1234", role="teacher")
+    for last_name in ("Avery", "Brook", "Cole"):
+        User.objects.create_user(
+            email=f"{last_name.lower()}@example.com",
+            password="pass1234",
+            role="student",
+            last_name=last_name,
+        )
+    _complete_questionnaire(User.objects.get(last_name="Cole"))
+    client.force_login(teacher)
+    url = reverse("users:student_list")
+
+    # session + user + count + one page of students (completion is annotated)
+    with django_assert_num_queries(4):
+        response = client.get(url, {"sort": "questionnaire"})
+    assert [s.last_name for s in response.context["students"]] == ["Cole", "Avery", "Brook"]
+    assert [s.questionnaire_complete for s in response.context["students"]] == [True, False, False]
+
+    response = client.get(url, {"sort": "questionnaire", "direction": "desc"})
+    assert [s.last_name for s in response.context["students"]] == ["Brook", "Avery", "Cole"]
+
+
+@pytest.mark.django_db
+def test_student_list_is_paginated(client, monkeypatch):
+    monkeypatch.setattr("users.views.LIST_PAGE_SIZE", 2)
+    teacher = User.objects.create_user(email="t@example.com", password="pass1234", role="teacher")
+    for last_name in ("Avery", "Brook", "Cole"):
+        User.objects.create_user(
+            email=f"{last_name.lower()}@example.com",
+            password="pass1234",
+            role="student",
+            last_name=last_name,
+        )
+    client.force_login(teacher)
+    url = reverse("users:student_list")
+
+    response = client.get(url)
+    assert [s.last_name for s in response.context["students"]] == ["Avery", "Brook"]
+    assert response.context["page_obj"].paginator.count == 3
+    assert b"Total: 3 students" in response.content
+
+    response = client.get(url, {"page": 2})
+    assert [s.last_name for s in response.context["students"]] == ["Cole"]
+
+
+@pytest.mark.django_db
+def test_student_list_rows_are_cached_until_a_student_changes(client, django_assert_num_queries):
+    teacher = User.objects.create_user(email="t@example.com", password="pass1234", role="teacher")
+    student = User.objects.create_user(
+        email="avery@example.com", password="pass1234", role="student", last_name="Avery"
+    )
+    client.force_login(teacher)
+    url = reverse("users:student_list")
+    client.get(url)
+
+    # session + user only; count and rows come from the cache
+    with django_assert_num_queries(2):
+        response = client.get(url)
+    assert [s.last_name for s in response.context["students"]] == ["Avery"]
+
+    _complete_questionnaire(student)
+    response = client.get(url)
+    assert [s.questionnaire_complete for s in response.context["students"]] == [True]
+
+    User.objects.create_user(
+        email="brook@example.com", password="pass1234", role="student", last_name="Brook"
+    )
+    response = client.get(url)
+    assert [s.last_name for s in response.context["students"]] == ["Avery", "Brook"]
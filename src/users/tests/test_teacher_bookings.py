@@ -0,0 +1,57 @@
+# src/users/tests/test_teacher_bookings.py
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+import pytest
+
+from availability.models import Availability
+from booking.models import Booking
+
+User = get_user_model()
+
+
+@pytest.fixture
+def teacher(client):
+    teacher = User.objects.create_user(email="t@example.com", password="pass1234", role="teacher")
+    client.force_login(teacher)
+    return teacher
+
+
+def _book(teacher, student, day, hour):
+    slot = Availability.objects.create(teacher=teacher, date=day, start_time=datetime.time(hour))
+    return Booking.objects.create(availability=slot, student=student)
+
+
+@pytest.mark.django_db
+def test_teacher_bookings_pinned_date_respects_past_toggle(
+    client, teacher, django_assert_num_queries
+):
+    student = User.objects.create_user(email="s@example.com", password="pass1234", role="student")
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    booking = _book(teacher, student, yesterday, 9)
+    url = reverse("users:teacher_bookings")
+
+    response = client.get(url, {"show": "past", "date": yesterday.isoformat()})
+    assert list(response.context["bookings"]) == [booking]
+
+    # A past date under "upcoming" matches nothing: session + user, no bookings query
+    with django_assert_num_queries(2):
+        response = client.get(url, {"date": yesterday.isoformat()})
+    assert list(response.context["bookings"]) == []
+
+
+@pytest.mark.django_db
+def test_teacher_bookings_are_paginated(client, teacher, monkeypatch):
+    monkeypatch.setattr("users.views.LIST_PAGE_SIZE", 2)
+    student = User.objects.create_user(email="s@example.com", password="pass1234", role="student")
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    bookings = [_book(teacher, student, tomorrow, hour) for hour in (9, 10, 11)]
+    url = reverse("users:teacher_bookings")
+
+    response = client.get(url)
+    assert list(response.context["bookings"]) == bookings[:2]
+    assert b"?page=2" in response.content
+
+    response = client.get(url, {"page": 2})
+    assert list(response.context["bookings"]) == bookings[2:]
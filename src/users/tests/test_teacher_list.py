@@ -0,0 +1,25 @@
+# src/users/tests/test_teacher_list.py
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+import pytest
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_teacher_list_unknown_sort_falls_back_to_name(client):
+    admin = User.objects.create_user(email="a@example.com", password="pass1234", role="admin")
+    for last_name in ("Brook", "Avery"):
+        User.objects.create_user(
+            email=f"{last_name.lower()}@example.com",
+            password="pass1234",
+            role="teacher",
+            last_name=last_name,
+        )
+    client.force_login(admin)
+    url = reverse("users:teacher_list")
+
+    # Teachers have no questionnaire, so that student-only key sorts by name
+    response = client.get(url, {"sort": "questionnaire", "direction": "desc"})
+    assert response.status_code == 200
+    assert [t.last_name for t in response.context["teachers"]] == ["Brook", "Avery"]
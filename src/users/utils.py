@@ -7,9 +7,23 @@ from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from core.cache import bump_cache_version, cache_version
+
 from .constants import PWD_RESET_TPLS
 from .forms_invite import InvitePasswordResetForm
 
+USER_LIST_VERSION_KEY = "users:list-version"
+
+
+def user_list_version() -> int:
+    """Current cache version for the student/teacher list pages."""
+    return cache_version(USER_LIST_VERSION_KEY)
+
+
+def invalidate_user_list_cache() -> None:
+    """Invalidate every cached page of the user lists (called on user/questionnaire writes)."""
+    bump_cache_version(USER_LIST_VERSION_KEY)
+
 
 def send_set_password(email, *, domain="localhost:8000", use_https=False, from_email=None):
     form = InvitePasswordResetForm({"email": email})
@@ -1,7 +1,8 @@
 # users/views.py
 
 # Django imports
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+import functools
 
 from django.conf import settings
 from django.contrib import messages
@@ -17,21 +18,61 @@ from django.contrib.auth.views import (
     PasswordResetDoneView,
     PasswordResetView,
 )
-from django.db import transaction
-from django.shortcuts import redirect, render
-from django.urls import reverse, reverse_lazy
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.signals import setting_changed
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.dispatch import receiver
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import get_script_prefix, reverse, reverse_lazy
 from django.views.generic import CreateView
 
+from availability.utils import get_calendar_data
 from booking.models import Booking
+from profiles.models import StudentProfile
+from questionnaire.models import Questionnaire
 
 # Local imports
 from .constants import PWD_RESET_TPLS  # ← centralised template names
 from .decorators import role_required
-from .forms import ProfileUpdateForm, RegisterForm
+from .forms import EMAIL_IN_USE_MESSAGE, ProfileUpdateForm, RegisterForm
 from .mixins import AdminRequiredMixin
+from .utils import user_list_version
 
 User = get_user_model()
 
+# Use the project enum if present; resolved once rather than per login redirect
+ADMIN_ROLE = getattr(getattr(User, "Roles", None), "ADMIN", "admin")
+TEACHER_ROLE = getattr(getattr(User, "Roles", None), "TEACHER", "teacher")
+
+# Landing page per role when USERS_ROLE_REDIRECTS doesn't name one
+_DEFAULT_ROLE_URLS = {
+    ADMIN_ROLE: "users:admin_home",
+    TEACHER_ROLE: "users:teacher_home",
+}
+
+# Rows per page on the user and booking lists, and how long a user list page is cached
+LIST_PAGE_SIZE = 50
+LIST_CACHE_TIMEOUT = 60
+
+
+@functools.cache
+def _reverse_landing(url_name: str, script_prefix: str) -> str:
+    """
+    reverse() for the argument-less role landing pages, memoized per process.
+
+    The script prefix is part of the key because reverse() prepends it.
+    """
+    return reverse(url_name)
+
+
+@receiver(setting_changed, dispatch_uid="users.clear_landing_url_cache")
+def _clear_landing_urls(setting, **kwargs):
+    # Tests may swap the URLconf; Django clears its resolver caches for that too
+    if setting == "ROOT_URLCONF":
+        _reverse_landing.cache_clear()
+
 
 def _redirect_for_role(user: AbstractBaseUser) -> str:
     """
@@ -44,25 +85,10 @@ def _redirect_for_role(user: AbstractBaseUser) -> str:
 
     # 1) Honor dynamic settings (override_settings in tests will work here)
     mapping = getattr(settings, "USERS_ROLE_REDIRECTS", {}) or {}
-    url_name = mapping.get(role)
-    if url_name:
-        return reverse(url_name)
+    # 2) Sane defaults if the mapping is missing/incomplete (student or unknown → student home)
+    url_name = mapping.get(role) or _DEFAULT_ROLE_URLS.get(role, "users:student_home")
 
-    # 2) Sane defaults if the mapping is missing/incomplete
-    try:
-        # Use your project enum if present
-        teacher_val = getattr(User.Roles, "TEACHER", "teacher")
-        admin_val = getattr(User.Roles, "ADMIN", "admin")
-    except Exception:
-        teacher_val, admin_val = "teacher", "admin"
-
-    if role == admin_val:
-        return reverse("users:admin_home")
-    if role == teacher_val:
-        return reverse("users:teacher_home")
-
-    # default (student or unknown)
-    return reverse("users:student_home")
+    return _reverse_landing(url_name, get_script_prefix())
 
 
 # --------------------------
@@ -76,10 +102,14 @@ class EmailLoginView(LoginView):
 
         # Check if user is a student and has not completed questionnaire
         if user.role == "student" and getattr(settings, "FORCE_QUESTIONNAIRE_COMPLETION", False):
-            # Check if student profile exists and questionnaire is incomplete
-            if hasattr(user, "student_profile"):
-                if not user.student_profile.has_completed_questionnaire():
-                    return reverse("questionnaire:questionnaire")
+            # One query: the student has a profile but no completed questionnaire
+            needs_questionnaire = (
+                StudentProfile.objects.filter(user=user)
+                .exclude(questionnaires__completed=True)
+                .exists()
+            )
+            if needs_questionnaire:
+                return reverse("questionnaire:questionnaire")
 
         return _redirect_for_role(user)
 
@@ -197,45 +227,63 @@ def teacher_home(request):
     return render(request, "users/teacher_home.html", context)
 
 
+_TEACHER_BOOKING_FIELDS = (
+    "message",
+    "availability__date",
+    "availability__start_time",
+    "availability__meeting_type",
+    "availability__message",
+    "student__first_name",
+    "student__last_name",
+    "student__email",
+)
+
+
 @role_required(["teacher"])
 def teacher_bookings(request):
     """List advisor's bookings with upcoming/past toggle and date filter."""
-    from datetime import date, datetime
-
     today = date.today()
     show_past = request.GET.get("show") == "past"
     selected_date_str = request.GET.get("date", "").strip()
 
-    base_qs = Booking.objects.select_related(
-        "availability", "availability__teacher", "student"
-    ).filter(availability__teacher=request.user)
+    # The advisor is request.user, so only the slot and student rows are joined,
+    # and only the columns the booking cards show are fetched
+    base_qs = (
+        Booking.objects.select_related("availability", "student")
+        .only(*_TEACHER_BOOKING_FIELDS)
+        .filter(availability__teacher=request.user)
+    )
 
     selected_date = None
     if selected_date_str:
         try:
             selected_date = datetime.strptime(selected_date_str, "%Y-%m-%d").date()
-            base_qs = base_qs.filter(availability__date=selected_date)
         except ValueError:
             selected_date = None
 
+    if selected_date is not None:
+        # A pinned date is either entirely past or entirely upcoming, so the
+        # range predicate is redundant; a date on the other side of today
+        # matches nothing without asking the database.
+        if (selected_date < today) == show_past:
+            base_qs = base_qs.filter(availability__date=selected_date)
+        else:
+            base_qs = base_qs.none()
+    elif show_past:
+        base_qs = base_qs.filter(availability__date__lt=today)
+    else:
+        base_qs = base_qs.filter(availability__date__gte=today)
+
     if show_past:
-        bookings_qs = base_qs.filter(availability__date__lt=today).order_by(
-            "-availability__date",
-            "-availability__start_time",
-            "student__last_name",
-            "student__first_name",
-        )
+        ordering = ("-availability__date", "-availability__start_time")
     else:
-        bookings_qs = base_qs.filter(availability__date__gte=today).order_by(
-            "availability__date",
-            "availability__start_time",
-            "student__last_name",
-            "student__first_name",
-        )
+        ordering = ("availability__date", "availability__start_time")
+    bookings_qs = base_qs.order_by(*ordering, "student__last_name", "student__first_name")
 
-    bookings = list(bookings_qs)
+    bookings = Paginator(bookings_qs, LIST_PAGE_SIZE).get_page(request.GET.get("page"))
     context = {
         "bookings": bookings,
+        "page_obj": bookings,
         "show_past": show_past,
         "selected_date": selected_date_str if selected_date else "",
         "today": today,
@@ -246,10 +294,6 @@ def teacher_bookings(request):
 @role_required(["teacher"])
 def teacher_calendar(request):
     """Teacher calendar view."""
-    from datetime import date
-
-    from availability.utils import get_calendar_data
-
     today = date.today()
     calendar_data = get_calendar_data(today.year, today.month, teacher=request.user)
 
@@ -293,14 +337,13 @@ def admin_teacher_calendar(request, teacher_id):
 
     Allows admins to view and manage availability on behalf of a teacher.
     """
-    from datetime import date
-
-    from django.shortcuts import get_object_or_404
-
-    from availability.utils import get_calendar_data
-
-    # Get the teacher
-    teacher = get_object_or_404(User, id=teacher_id, role=User.Roles.TEACHER)
+    # One query validates id + role and loads just what the page shows; the
+    # calendar itself only needs the pk
+    teacher = get_object_or_404(
+        User.objects.only("id", "first_name", "last_name", "email"),
+        id=teacher_id,
+        role=User.Roles.TEACHER,
+    )
 
     today = date.today()
     calendar_data = get_calendar_data(today.year, today.month, teacher=teacher)
@@ -322,7 +365,8 @@ def admin_teacher_calendar(request, teacher_id):
 @login_required
 def profile_view(request):
     """View user profile information."""
-    return render(request, "users/profile.html", {"user": request.user})
+    # `user` comes from the auth context processor
+    return render(request, "users/profile.html")
 
 
 @login_required
@@ -331,9 +375,15 @@ def profile_edit(request):
     if request.method == "POST":
         form = ProfileUpdateForm(request.POST, instance=request.user)
         if form.is_valid():
-            form.save()
-            messages.success(request, "Your profile has been updated successfully.")
-            return redirect("users:profile")
+            try:
+                with transaction.atomic():
+                    form.save()
+            except IntegrityError:
+                # Another account took the address between validation and save
+                form.add_error("email", EMAIL_IN_USE_MESSAGE)
+            else:
+                messages.success(request, "Your profile has been updated successfully.")
+                return redirect("users:profile")
     else:
         form = ProfileUpdateForm(instance=request.user)
 
@@ -362,20 +412,75 @@ def change_password(request):
 # --------------------------
 
 
+def _sort_table(mappings: dict) -> dict:
+    """Expand sort key → ascending fields into (key, direction) → order_by fields."""
+    table = {}
+    for key, fields in mappings.items():
+        table[key, "asc"] = fields
+        # Descending flips every field, including ones already descending
+        table[key, "desc"] = tuple(f[1:] if f.startswith("-") else f"-{f}" for f in fields)
+    return table
+
+
+_USER_SORTS = {
+    "name": ("last_name", "first_name"),
+    "email": ("email",),
+    "joined": ("date_joined",),
+}
+_TEACHER_SORT_FIELDS = _sort_table(_USER_SORTS)
+_STUDENT_SORT_FIELDS = _sort_table(
+    {
+        **_USER_SORTS,
+        # Completed first, then by name
+        "questionnaire": ("-questionnaire_complete", "last_name", "first_name"),
+    }
+)
+
+# Columns the student/teacher list rows render (the pk is always included)
+_LIST_USER_FIELDS = ("first_name", "last_name", "email", "date_joined", "is_active")
+
+
+def _cached_list_page(request, queryset, list_name):
+    """
+    One page of a user list, with its total count.
+
+    The rows don't depend on who is looking, so they're cached per query string
+    (search, sort, page) until a user or questionnaire changes. The page is
+    rendered per request, which keeps messages, CSRF tokens and the navbar live.
+    """
+    key = f"users:list:{list_name}:{user_list_version()}:{request.GET.urlencode()}"
+    paginator = Paginator(queryset, LIST_PAGE_SIZE)
+    cached = cache.get(key)
+    if cached is not None:
+        paginator.count, rows = cached
+    page = paginator.get_page(request.GET.get("page"))
+    if cached is None:
+        rows = list(page.object_list)
+        cache.set(key, (paginator.count, rows), LIST_CACHE_TIMEOUT)
+    page.object_list = rows
+    return page
+
+
 @role_required(["teacher", "admin"])
 def student_list(request):
     """List all students for teachers and admins with search and sorting."""
+    # Completion is an EXISTS per row; has_completed_questionnaire() would query per student
     students = (
         User.objects.filter(role=User.Roles.STUDENT)
         .select_related("student_profile")
-        .prefetch_related("student_profile__questionnaires")
+        .only(*_LIST_USER_FIELDS, "student_profile__id")
+        .annotate(
+            questionnaire_complete=Exists(
+                Questionnaire.objects.filter(
+                    student_profile=OuterRef("student_profile"), completed=True
+                )
+            )
+        )
     )
 
     # Search functionality
     search_query = request.GET.get("q", "").strip()
     if search_query:
-        from django.db.models import Q
-
         students = students.filter(
             Q(first_name__icontains=search_query)
             | Q(last_name__icontains=search_query)
@@ -385,43 +490,19 @@ def student_list(request):
     # Sorting functionality
     sort_by = request.GET.get("sort", "name")
     direction = request.GET.get("direction", "asc")
+    order = "desc" if direction == "desc" else "asc"
+    # Unknown sort keys fall back to name, in the requested direction
+    sort_fields = _STUDENT_SORT_FIELDS.get((sort_by, order)) or _STUDENT_SORT_FIELDS["name", order]
 
-    # Define sort field mappings
-    sort_mappings = {
-        "name": ["last_name", "first_name"],
-        "email": ["email"],
-        "joined": ["date_joined"],
-    }
-
-    # Get the sort fields
-    sort_fields = sort_mappings.get(sort_by, ["last_name", "first_name"])
-
-    # Apply direction prefix
-    if direction == "desc":
-        sort_fields = [f"-{field}" for field in sort_fields]
-
-    students = list(students.order_by(*sort_fields))
-
-    # Special handling for questionnaire sorting
-    if sort_by == "questionnaire":
-        students.sort(
-            key=lambda s: (
-                not (
-                    hasattr(s, "student_profile")
-                    and s.student_profile
-                    and s.student_profile.has_completed_questionnaire()
-                ),
-                s.last_name or "",
-                s.first_name or "",
-            ),
-            reverse=(direction == "desc"),
-        )
+    # LIMIT/OFFSET in SQL so only one page of rows is loaded and rendered
+    page = _cached_list_page(request, students.order_by(*sort_fields), "students")
 
     return render(
         request,
         "users/student_list.html",
         {
-            "students": students,
+            "students": page,
+            "page_obj": page,
             "search_query": search_query,
             "current_sort": sort_by,
             "current_direction": direction,
@@ -432,13 +513,11 @@ def student_list(request):
 @role_required(["admin"])
 def teacher_list(request):
     """List all teachers for admin with search and sorting."""
-    teachers = User.objects.filter(role=User.Roles.TEACHER)
+    teachers = User.objects.filter(role=User.Roles.TEACHER).only(*_LIST_USER_FIELDS)
 
     # Search functionality
     search_query = request.GET.get("q", "").strip()
     if search_query:
-        from django.db.models import Q
-
         teachers = teachers.filter(
             Q(first_name__icontains=search_query)
             | Q(last_name__icontains=search_query)
@@ -448,28 +527,18 @@ def teacher_list(request):
     # Sorting functionality
     sort_by = request.GET.get("sort", "name")
     direction = request.GET.get("direction", "asc")
+    order = "desc" if direction == "desc" else "asc"
+    # Unknown sort keys fall back to name, in the requested direction
+    sort_fields = _TEACHER_SORT_FIELDS.get((sort_by, order)) or _TEACHER_SORT_FIELDS["name", order]
 
-    # Define sort field mappings
-    sort_mappings = {
-        "name": ["last_name", "first_name"],
-        "email": ["email"],
-        "joined": ["date_joined"],
-    }
-
-    # Get the sort fields
-    sort_fields = sort_mappings.get(sort_by, ["last_name", "first_name"])
-
-    # Apply direction prefix
-    if direction == "desc":
-        sort_fields = [f"-{field}" for field in sort_fields]
-
-    teachers = teachers.order_by(*sort_fields)
+    page = _cached_list_page(request, teachers.order_by(*sort_fields), "teachers")
 
     return render(
         request,
         "users/teacher_list.html",
         {
-            "teachers": teachers,
+            "teachers": page,
+            "page_obj": page,
             "search_query": search_query,
             "current_sort": sort_by,
             "current_direction": direction,